@@ -0,0 +1,676 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2018 Egor Zindy <egor.zindy@manchester.ac.uk>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# vim: set ts=4 sts=4 sw=4 expandtab smartindent:
+
+"""NumPy kernels shared by BridgeLib and the XTensions.
+
+Nothing in here talks to Imaris, so these can be used (and timed) outside
+of an Imaris session. Large arrays are processed in chunks of CHUNK_SIZE
+elements so that the temporaries stay small (and in cache).
+"""
+
+import ast
+import collections
+import multiprocessing
+import threading
+import time
+import numpy as np
+from multiprocessing.pool import ThreadPool
+
+#Number of array elements processed at a time by the chunked kernels
+CHUNK_SIZE = 1<<18
+
+#Number of chunks in a block, the unit of work handed to a worker thread
+BLOCK_CHUNKS = 16
+
+#Number of threads in the compute pool (see GetComputePool)
+COMPUTE_THREADS = multiprocessing.cpu_count()
+
+_compute_pool = None
+_compute_lock = threading.Lock()
+
+###########################################################################
+## Helper functions
+###########################################################################
+def GetTypeRange(dtype):
+    """Get the minimum and maximum values that can be represented by dtype"""
+    dtype = np.dtype(dtype)
+    if dtype.kind in 'ui':
+        info = np.iinfo(dtype)
+    else:
+        info = np.finfo(dtype)
+    return info.min,info.max
+
+def GetComputePool():
+    """A thread pool (COMPUTE_THREADS workers) shared by the chunked kernels.
+
+    Large NumPy ufunc calls release the GIL, so blocks of an array can be
+    processed by several cores at the same time."""
+    global _compute_pool
+    with _compute_lock:
+        if _compute_pool is None:
+            _compute_pool = ThreadPool(COMPUTE_THREADS)
+    return _compute_pool
+
+def IterChunks(n,chunk=None):
+    """Iterate over the (start, stop) bounds of chunks covering n elements"""
+    if chunk is None:
+        chunk = CHUNK_SIZE
+    for i in range(0,n,chunk):
+        yield i,min(i+chunk,n)
+
+class StageTimer(object):
+    """Wall-clock time spent in the successive stages of a calculation.
+    start(name) ends the current stage and starts the next one, the times of stages with the same name add up."""
+    def __init__(self):
+        self.times = collections.OrderedDict()
+        self.stage = None
+        self.t0 = None
+
+    def start(self,name):
+        self.stop()
+        self.stage = name
+        self.t0 = time.time()
+
+    def stop(self):
+        if self.stage is not None:
+            self.times[self.stage] = self.times.get(self.stage,0.)+time.time()-self.t0
+            self.stage = None
+
+    def total(self):
+        return sum(self.times.values())
+
+    def __str__(self):
+        return ", ".join(["%s %.3f s" % (name,t) for name,t in self.times.items()])
+
+def ClipCast(arr,dtype,out=None,chunk=None):
+    """Clip arr to the range of dtype, round (for integer types) and cast it.
+
+    The work is done one chunk at a time, so besides out, only a chunk-sized
+    temporary is allocated. arr is left untouched. out (a C-contiguous
+    array of arr's shape and of type dtype) can be reused between calls.
+    Returns out."""
+    dtype = np.dtype(dtype)
+    if out is None:
+        out = np.empty(arr.shape,dtype)
+    elif out.shape != arr.shape or out.dtype != dtype or not out.flags.c_contiguous:
+        raise ValueError("out must be a C-contiguous %s array of shape %s" % (dtype.name,str(arr.shape)))
+
+    if arr.dtype == dtype:
+        out[...] = arr
+        return out
+
+    lo,hi = GetTypeRange(dtype)
+
+    #Clipping bounds must be representable in the source type
+    if arr.dtype.kind in 'ui':
+        arr_lo,arr_hi = GetTypeRange(arr.dtype)
+        lo,hi = max(lo,arr_lo),min(hi,arr_hi)
+    lo = np.array(lo).astype(arr.dtype)
+    hi = np.array(hi).astype(arr.dtype)
+
+    do_round = dtype.kind in 'ui' and arr.dtype.kind == 'f'
+
+    #Non-contiguous arrays are flattened into a copy
+    src = np.ravel(arr)
+    dst = out.reshape(-1)
+
+    n = src.shape[0]
+    if chunk is None:
+        chunk = CHUNK_SIZE
+    tmp = np.empty(min(n,chunk),arr.dtype)
+
+    for i,j in IterChunks(n,chunk):
+        t = tmp[:j-i]
+        np.clip(src[i:j],lo,hi,out=t)
+        if do_round:
+            np.rint(t,out=t)
+        dst[i:j] = t
+
+    return out
+
+def _SanitizeChunk(d,lo,hi):
+    """In place, replace inf / NaN values by lo and clip to [lo,hi]. Returns the (min, max) of the chunk"""
+    np.copyto(d,lo,where=~np.isfinite(d))
+    np.clip(d,lo,hi,out=d)
+    return d.min(),d.max()
+
+def _CombineRanges(ranges):
+    ranges = [r for r in ranges if r is not None]
+    if len(ranges) == 0:
+        return None,None
+    return min([r[0] for r in ranges]),max([r[1] for r in ranges])
+
+def SanitizeRange(arr,lo,hi,out=None,chunk=None,pool=None):
+    """Replace inf / NaN values by lo, clip to [lo,hi] and get the resulting min and max, in a single pass.
+
+    Each chunk is scrubbed, clipped and measured while it is in cache,
+    instead of going over the whole array once per step. The work is done
+    in place unless out is given. If a pool (see GetComputePool) is given,
+    blocks of the array are processed by its workers.
+    Returns (out, min, max)."""
+    #Otherwise, each chunk is copied to out before it is processed
+    in_place = out is None or out is arr
+    if out is None:
+        out = arr
+    elif out.shape != arr.shape or not out.flags.c_contiguous:
+        raise ValueError("out must be a C-contiguous array of shape %s" % str(arr.shape))
+
+    src = np.ravel(arr)
+    dst = out.reshape(-1)
+
+    n = dst.shape[0]
+    if chunk is None:
+        chunk = CHUNK_SIZE
+
+    def sanitize_block(bounds):
+        i0,j0 = bounds
+        ranges = []
+        with np.errstate(invalid='ignore'):
+            for i,j in IterChunks(j0-i0,chunk):
+                d = dst[i0+i:i0+j]
+                if not in_place:
+                    d[...] = src[i0+i:i0+j]
+                ranges.append(_SanitizeChunk(d,lo,hi))
+        return _CombineRanges(ranges)
+
+    if pool is None:
+        ranges = [sanitize_block((0,n))]
+    else:
+        ranges = pool.map(sanitize_block,list(IterChunks(n,chunk*BLOCK_CHUNKS)))
+
+    mi,ma = _CombineRanges(ranges)
+    return out,mi,ma
+
+def BenchmarkSanitize(shape=(64,1024,1024),repeat=3):
+    """Compare the masked scrub / clamp / min / max sequence with SanitizeRange"""
+    def masked(arr,lo,hi):
+        #One pass per step, and one boolean temporary per mask
+        arr[arr == np.inf] = lo
+        arr[np.isnan(arr)] = lo
+        arr[arr < lo] = lo
+        arr[arr > hi] = hi
+        return arr,np.min(arr),np.max(arr)
+
+    rng = np.random.RandomState(0)
+    data = (rng.standard_normal(shape)*20000+30000).astype(np.float32)
+    data.reshape(-1)[::1000] = np.inf
+    data.reshape(-1)[1::1000] = np.nan
+
+    for name,func,passes in [("masked",masked,6),("SanitizeRange",SanitizeRange,1),
+            ("SanitizeRange (pool)",lambda arr,lo,hi: SanitizeRange(arr,lo,hi,pool=GetComputePool()),1)]:
+        best = None
+        for i in range(repeat):
+            arr = data.copy()
+            t = time.time()
+            arr,mi,ma = func(arr,0,65535)
+            t = time.time()-t
+            if best is None or t < best:
+                best = t
+        print("%-22s %d pass(es) over %d MB: %.3f s  range %g-%g" % (name,passes,data.nbytes // (1024*1024),best,mi,ma))
+
+def Threshold(arr,lo,hi,below=None,normalise=None,dtype=None,out=None,chunk=None,pool=None):
+    """Threshold, normalise and cast arr in a single pass.
+
+    Values above hi become hi, values below lo become below (lo by default,
+    which is a plain clip). If normalise is a (in_lo, in_hi, out_lo, out_hi)
+    tuple, the thresholded values are then mapped linearly from [in_lo,in_hi]
+    to [out_lo,out_hi]. Finally, the values are clipped, rounded and cast to
+    dtype (arr's type by default) as in ClipCast. arr is left untouched,
+    only chunk-sized temporaries are allocated. If a pool is given, blocks
+    of the array are processed by its workers. Returns out."""
+    if dtype is None:
+        dtype = arr.dtype
+    dtype = np.dtype(dtype)
+    if out is None:
+        out = np.empty(arr.shape,dtype)
+    elif out.shape != arr.shape or out.dtype != dtype or not out.flags.c_contiguous:
+        raise ValueError("out must be a C-contiguous %s array of shape %s" % (dtype.name,str(arr.shape)))
+
+    #The work is done in floating point (arr's type if it is one)
+    ftype = arr.dtype if arr.dtype.kind == 'f' else np.dtype(np.float32)
+    if below is None:
+        below = lo
+
+    scale = None
+    if normalise is not None:
+        in_lo,in_hi,out_lo,out_hi = normalise
+        scale = 0.
+        if in_hi != in_lo:
+            scale = (out_hi-out_lo)/float(in_hi-in_lo)
+
+    tlo,thi = GetTypeRange(dtype)
+    do_round = dtype.kind in 'ui' and ftype != dtype
+
+    src = np.ravel(arr)
+    dst = out.reshape(-1)
+
+    n = src.shape[0]
+    if chunk is None:
+        chunk = CHUNK_SIZE
+
+    def threshold_block(bounds):
+        i0,j0 = bounds
+        tmp = np.empty(min(j0-i0,chunk),ftype)
+        for i,j in IterChunks(j0-i0,chunk):
+            s = src[i0+i:i0+j]
+            t = tmp[:j-i]
+            np.minimum(s,hi,out=t)
+            np.copyto(t,below,where=s < lo)
+            if scale is not None:
+                t -= in_lo
+                t *= scale
+                t += out_lo
+            if dtype.kind in 'ui':
+                np.clip(t,tlo,thi,out=t)
+            if do_round:
+                np.rint(t,out=t)
+            dst[i0+i:i0+j] = t
+
+    if pool is None:
+        threshold_block((0,n))
+    else:
+        pool.map(threshold_block,list(IterChunks(n,chunk*BLOCK_CHUNKS)))
+
+    return out
+
+def GetThresholdRange(mi,ma,lo,hi,below=None):
+    """The (min, max) of data ranging from mi to ma once thresholded as in Threshold (without normalisation).
+    below is not above lo, so the thresholding is monotonic and the data need not be scanned again."""
+    if below is None:
+        below = lo
+
+    def threshold(v):
+        if v < lo:
+            return below
+        return min(v,hi)
+
+    return threshold(mi),threshold(ma)
+
+class VolumeHistogram(object):
+    """Histogram of an array, from which the min, max, percentiles and an
+    Otsu threshold are read without going back to the voxels.
+
+    8 and 16 bit integer data get one bin per value, so everything read
+    from these is exact. Other types are binned: bins of equal width over
+    [lo,hi] if given (values outside are counted in the first / last bin),
+    otherwise over a range that doubles whenever a chunk falls outside of
+    it, so that the histogram is still built in a single pass. min and max
+    are always exact. Several arrays can be added to the same histogram.
+    """
+    def __init__(self,dtype,bins=4096,lo=None,hi=None):
+        dtype = np.dtype(dtype)
+        self.exact = dtype.kind in 'ui' and dtype.itemsize <= 2
+        self.fixed = self.exact or (lo is not None and hi is not None)
+
+        if self.exact:
+            self.lo = int(GetTypeRange(dtype)[0])
+            self.width = 1
+            bins = 1 << (8*dtype.itemsize)
+        elif self.fixed:
+            self.lo = float(lo)
+            self.width = max(float(hi)-float(lo),1.)/bins
+        else:
+            #Set by the first chunk. The range is doubled by merging pairs of bins
+            self.lo = None
+            self.width = None
+            bins += bins % 2
+
+        self.counts = np.zeros(bins,np.int64)
+        self.total = 0
+        self.min = None
+        self.max = None
+
+    @property
+    def nbytes(self):
+        return self.counts.nbytes
+
+    def add(self,arr,chunk=None):
+        """Add the values of arr (inf and NaN values are ignored), one chunk at a time. Returns self."""
+        src = np.ravel(arr)
+        for i,j in IterChunks(src.shape[0],chunk):
+            self._AddChunk(src[i:j])
+        return self
+
+    def merge(self,other):
+        """Add the values counted by another histogram, without going back to its data. Returns self.
+        Unless both histograms share the same bins, other's bins are re-binned by their centre."""
+        if other.total == 0:
+            return self
+
+        n = self.counts.shape[0]
+        if self.exact == other.exact and self.lo == other.lo and self.width == other.width and n == other.counts.shape[0]:
+            self.counts += other.counts
+        else:
+            centres = other._Centres()
+            if not self.fixed:
+                self._Cover(float(min(centres[0],other.min)),float(max(centres[-1],other.max)))
+            t = (centres-self.lo)/self.width
+            np.clip(t,0,n-1,out=t)
+            self.counts += np.bincount(t.astype(np.intp),weights=other.counts,minlength=n).astype(np.int64)
+
+        self.total += other.total
+        if self.min is None or other.min < self.min:
+            self.min = other.min
+        if self.max is None or other.max > self.max:
+            self.max = other.max
+        return self
+
+    def _AddChunk(self,d):
+        if d.shape[0] == 0:
+            return
+
+        n = self.counts.shape[0]
+        mi,ma = d.min(),d.max()
+        if self.exact:
+            idx = d
+            if self.lo != 0:
+                idx = d.astype(np.intp)-self.lo
+        else:
+            if not (np.isfinite(mi) and np.isfinite(ma)):
+                d = d[np.isfinite(d)]
+                if d.shape[0] == 0:
+                    return
+                mi,ma = d.min(),d.max()
+            if not self.fixed:
+                self._Cover(float(mi),float(ma))
+            t = np.subtract(d,self.lo,dtype=np.float64)
+            t /= self.width
+            np.clip(t,0,n-1,out=t)
+            idx = t.astype(np.intp)
+
+        self.counts += np.bincount(idx,minlength=n)
+        self.total += d.shape[0]
+        if self.min is None or mi < self.min:
+            self.min = mi
+        if self.max is None or ma > self.max:
+            self.max = ma
+
+    def _Cover(self,mi,ma):
+        """Grow the range (if needed) so that it covers [mi,ma]"""
+        n = self.counts.shape[0]
+        if self.lo is None:
+            self.lo = mi
+            self.width = max(ma-mi,abs(mi)*1e-6,1e-12)/n
+
+        while mi < self.lo or ma > self.lo+self.width*n:
+            merged = self.counts.reshape(-1,2).sum(axis=1)
+            self.counts[:] = 0
+            if mi < self.lo:
+                self.counts[n//2:] = merged
+                self.lo -= self.width*n
+            else:
+                self.counts[:n//2] = merged
+            self.width *= 2
+
+    def _Centres(self):
+        """The value of each bin"""
+        centres = np.arange(self.counts.shape[0],dtype=np.float64)
+        if not self.exact:
+            centres += 0.5
+        return self.lo+centres*self.width
+
+    def _CountBelow(self,value,inclusive):
+        """Number of values below value (or equal to, if inclusive), interpolated within a bin"""
+        if self.total == 0:
+            return 0.
+        n = self.counts.shape[0]
+        if self.exact:
+            i = int(np.floor(value)) if inclusive else int(np.ceil(value))-1
+            i -= self.lo
+            if i < 0:
+                return 0.
+            return float(self.counts[:min(i,n-1)+1].sum())
+
+        p = (value-self.lo)/self.width
+        if p <= 0:
+            return 0.
+        if p >= n:
+            return float(self.total)
+        i = int(p)
+        return float(self.counts[:i].sum())+self.counts[i]*(p-i)
+
+    def count(self,lo,hi):
+        """Number of values in [lo,hi]"""
+        if self.total == 0 or hi < lo:
+            return 0.
+
+        #Exact counts at either end of the range
+        below_hi = self.total if hi >= self.max else self._CountBelow(hi,True)
+        below_lo = 0 if lo <= self.min else self._CountBelow(lo,False)
+        return max(0.,below_hi-below_lo)
+
+    def percentile(self,q):
+        """The q-th percentile (q in [0,100]) of the values, interpolated within a bin"""
+        if self.total == 0:
+            return None
+        target = q/100.*self.total
+        cum = np.cumsum(self.counts)
+        i = min(int(np.searchsorted(cum,target)),cum.shape[0]-1)
+
+        if self.exact:
+            value = self.lo+i
+        else:
+            before = cum[i]-self.counts[i]
+            frac = 0.
+            if self.counts[i] > 0:
+                frac = (target-before)/float(self.counts[i])
+            value = self.lo+(i+frac)*self.width
+        return min(max(value,self.min),self.max)
+
+    def otsu(self):
+        """Otsu's threshold, maximising the between-class variance of the values at or below it and those above it"""
+        if self.total == 0:
+            return None
+        p = self.counts.astype(np.float64)
+        centres = self._Centres()
+        w0 = np.cumsum(p)
+        w1 = self.total-w0
+        m0 = np.cumsum(p*centres)
+        with np.errstate(divide='ignore',invalid='ignore'):
+            between = (m0[-1]*w0-m0*self.total)**2/(w0*w1)
+        between[~np.isfinite(between)] = 0
+        i = int(np.argmax(between))
+
+        if self.exact:
+            return self.lo+i
+        return self.lo+(i+1)*self.width
+
+###########################################################################
+## Channel arithmetic
+###########################################################################
+_binary_operators = {
+    ast.Add: np.add,
+    ast.Sub: np.subtract,
+    ast.Mult: np.multiply,
+    ast.Div: np.divide,
+    ast.Pow: np.power,
+}
+
+_unary_operators = {
+    ast.USub: np.negative,
+}
+
+_functions = {
+    'min': (np.minimum,2),
+    'max': (np.maximum,2),
+    'abs': (np.absolute,1),
+    'sqrt': (np.sqrt,1),
+    'exp': (np.exp,1),
+    'log': (np.log,1),
+    'log10': (np.log10,1),
+}
+
+class Expression(object):
+    """Channel arithmetic, e.g. "(A*1.2 - B) / max(C, 1)".
+
+    Variables are capital letters (one per channel). The expression can use
+    + - * / ** and the functions min, max, abs, sqrt, exp, log and log10.
+    It is compiled once into a plan of NumPy ufunc calls, then evaluated one
+    chunk at a time in float32, each step writing into a chunk-sized
+    register. The whole expression needs a single pass over the data.
+    """
+    def __init__(self,text):
+        self.text = text
+        try:
+            tree = ast.parse(text.strip(),mode='eval')
+        except SyntaxError:
+            raise ValueError("invalid expression: '%s'" % text)
+
+        #The plan is a list of (ufunc, operands, register) steps
+        self.plan = []
+        self.nregisters = 0
+        self._free = []
+
+        self.result = self._Compile(tree.body)
+        self.variables = sorted(set([operand[1] for step in self.plan for operand in step[1] if operand[0] == 'var']))
+        if self.result[0] == 'var' and self.result[1] not in self.variables:
+            self.variables.append(self.result[1])
+
+    def _Register(self):
+        if self._free:
+            return self._free.pop()
+        self.nregisters += 1
+        return self.nregisters-1
+
+    def _Step(self,ufunc,operands):
+        #Constant folding
+        if all([operand[0] == 'const' for operand in operands]):
+            return ('const',float(ufunc(*[operand[1] for operand in operands])))
+
+        #The registers read by this step can be reused by the next steps
+        for operand in operands:
+            if operand[0] == 'reg':
+                self._free.append(operand[1])
+
+        register = self._Register()
+        self.plan.append((ufunc,operands,register))
+        return ('reg',register)
+
+    def _Compile(self,node):
+        """Compiles an ast node, returns an operand: ('var',name), ('const',value) or ('reg',index)"""
+        if isinstance(node,ast.BinOp) and type(node.op) in _binary_operators:
+            return self._Step(_binary_operators[type(node.op)],[self._Compile(node.left),self._Compile(node.right)])
+
+        elif isinstance(node,ast.UnaryOp) and type(node.op) in _unary_operators:
+            return self._Step(_unary_operators[type(node.op)],[self._Compile(node.operand)])
+
+        elif isinstance(node,ast.UnaryOp) and isinstance(node.op,ast.UAdd):
+            return self._Compile(node.operand)
+
+        elif isinstance(node,ast.Call) and isinstance(node.func,ast.Name) and node.func.id in _functions:
+            ufunc,nargs = _functions[node.func.id]
+            if len(node.args) != nargs or node.keywords:
+                raise ValueError("%s() takes %d argument(s)" % (node.func.id,nargs))
+            return self._Step(ufunc,[self._Compile(arg) for arg in node.args])
+
+        elif isinstance(node,ast.Name):
+            if len(node.id) != 1 or not node.id.isupper():
+                raise ValueError("unknown variable '%s' (channels are A, B, C...)" % node.id)
+            return ('var',node.id)
+
+        elif isinstance(node,getattr(ast,'Constant',())) and isinstance(node.value,(int,float)):
+            return ('const',float(node.value))
+
+        #Python 2 numbers
+        elif isinstance(node,getattr(ast,'Num',())):
+            return ('const',float(node.n))
+
+        raise ValueError("unsupported syntax in expression: '%s'" % self.text)
+
+    def evaluate(self,arrays,out=None,lo=None,hi=None,chunk=None,pool=None,return_range=False):
+        """Evaluate the expression.
+
+        arrays is a dictionary of same-shape arrays, one per variable. The
+        float32 result is written into out (allocated if None). If lo and hi
+        are given, inf and NaN values are replaced by lo and the result is
+        clipped to [lo,hi]. Returns out.
+
+        If a pool (e.g. GetComputePool()) is given, Z slabs of whole planes
+        (rows for an image), of about BLOCK_CHUNKS chunks each, are evaluated
+        by its workers, each writing straight into out.
+
+        With return_range (and lo, hi given), the min and max of the result
+        are measured in the same pass and (out, min, max) is returned."""
+        missing = [name for name in self.variables if name not in arrays]
+        if missing:
+            raise ValueError("no channel given for %s" % ", ".join(missing))
+
+        if self.variables:
+            shape = arrays[self.variables[0]].shape
+        elif out is not None:
+            shape = out.shape
+        else:
+            raise ValueError("a constant expression needs an out array")
+
+        if out is None:
+            out = np.empty(shape,np.float32)
+
+        flat = dict([(name,np.ravel(arrays[name])) for name in self.variables])
+        dst = out.reshape(-1)
+
+        n = dst.shape[0]
+        if chunk is None:
+            chunk = CHUNK_SIZE
+
+        def evaluate_block(bounds):
+            i0,j0 = bounds
+
+            #Each block has its own registers
+            registers = [np.empty(min(j0-i0,chunk),np.float32) for k in range(self.nregisters)]
+            ranges = []
+            with np.errstate(all='ignore'):
+                for i,j in IterChunks(j0-i0,chunk):
+                    ranges.append(self._EvaluateChunk(flat,registers,dst,i0+i,i0+j,lo,hi))
+            return _CombineRanges(ranges)
+
+        if pool is None:
+            ranges = [evaluate_block((0,n))]
+        else:
+            #The blocks are cut on whole planes (at least one per block)
+            plane = max(1,int(np.prod(shape[1:])))
+            block = max(1,chunk*BLOCK_CHUNKS // plane)*plane
+            ranges = pool.map(evaluate_block,list(IterChunks(n,block)))
+
+        if return_range:
+            mi,ma = _CombineRanges(ranges)
+            return out,mi,ma
+        return out
+
+    def _EvaluateChunk(self,flat,registers,dst,i,j,lo,hi):
+        """Run the plan for the [i,j) chunk, the result is written to dst[i:j]
+        Returns the (min, max) of the chunk if lo and hi are given, otherwise None"""
+        def resolve(operand):
+            kind,value = operand
+            if kind == 'var':
+                return flat[value][i:j]
+            elif kind == 'reg':
+                return registers[value][:j-i]
+            return value
+
+        #The ufunc loops run in float32 (integer inputs would otherwise wrap around)
+        for ufunc,operands,register in self.plan:
+            ufunc(*[resolve(operand) for operand in operands],out=registers[register][:j-i],dtype=np.float32)
+
+        d = dst[i:j]
+        d[...] = resolve(self.result)
+
+        if lo is not None and hi is not None:
+            return _SanitizeChunk(d,lo,hi)
+
+if __name__ == "__main__":
+    BenchmarkSanitize()
@@ -0,0 +1,402 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2018 Egor Zindy <egor.zindy@manchester.ac.uk>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# vim: set ts=4 sts=4 sw=4 expandtab smartindent:
+
+"""Wavelet (à trous) computations used by XTAtrous.
+
+Like ArrayLib, nothing in here talks to Imaris or Tk, so the worker
+processes of a BandpassPool only need NumPy and libatrous.
+"""
+
+import collections
+import itertools
+import multiprocessing
+import os
+import sys
+import numpy as np
+
+#The tile and pool sizing helpers don't need libatrous, only the filtering does
+try:
+    import libatrous
+except ImportError:
+    libatrous = None
+
+from multiprocessing.sharedctypes import RawArray
+
+#Number of worker processes of a BandpassPool (1 or less: compute in the calling process)
+PROCESSES = multiprocessing.cpu_count()
+
+#Memory budget for the shared input / output buffers of a BandpassPool, None: sized from the available memory (see GetSharedBytes)
+SHARED_BYTES = None
+
+#Number of float32 copies of a volume held while it is filtered (raw data, intermediate scales, result)
+WORKING_COPIES = 4
+
+#Share of the available memory these copies may take, larger volumes are filtered in tiles (see UseTiles)
+MEMORY_FRACTION = 0.5
+
+#Largest float32 tile (halo included) when filtering in tiles and the available memory is unknown (see GetTileBytes)
+TILE_BYTES = 256*1024*1024
+
+#Size of the float32 volumes filtered for a fast preview (see GetPreviewFactor)
+PREVIEW_BYTES = 16*1024*1024
+
+###########################################################################
+## Band-pass filter
+###########################################################################
+def GetBandpass(dataset,params):
+    """The band-pass filtered (float32) dataset.
+    params is a (kernel_type, low_scale, high_scale, check_invert, check_lowpass) tuple, scales start at 1.
+    check_invert is not used here, dataset is expected to be inverted already."""
+    kernel_type,low_scale,high_scale,check_invert,check_lowpass = params
+    kernel = libatrous.get_kernel(kernel_type)
+    return libatrous.get_bandpass(dataset,low_scale-1,high_scale-1,kernel,check_lowpass)
+
+def GetPlaneParams(params,scale):
+    """The band-pass parameters of the cumulative detail plane for scale: the detail planes from scale 1 to scale, without the residual low-pass"""
+    return (params[0],1,scale,params[3],False)
+
+def CombinePlanes(dataset,params,get_plane):
+    """The band-pass of dataset (see GetBandpass), from cumulative detail planes.
+
+    get_plane(scale) returns the sum of the detail planes 1 to scale (see
+    GetPlaneParams). Scales low_scale to high_scale are the difference of
+    two such planes, and adding the residual low-pass leaves dataset minus
+    the planes below low_scale. Any band is then assembled from cached planes
+    without filtering the data again. The result is always a new array, so
+    that it can be cached on its own (the planes may be spilled or evicted)."""
+    kernel_type,low_scale,high_scale,check_invert,check_lowpass = params
+    if check_lowpass:
+        if low_scale <= 1:
+            return np.array(dataset,dtype=np.float32)
+        return dataset-get_plane(low_scale-1)
+
+    if low_scale > 1:
+        return get_plane(high_scale)-get_plane(low_scale-1)
+    return np.array(get_plane(high_scale))
+
+###########################################################################
+## Tiled band-pass filter
+###########################################################################
+def GetAvailableMemory():
+    """The physical memory available to this process in bytes, None if it can't be found out.
+    psutil is used if installed, otherwise the operating system is asked directly."""
+    try:
+        import psutil
+        return int(psutil.virtual_memory().available)
+    except ImportError:
+        pass
+
+    if sys.platform == "win32":
+        import ctypes
+
+        class MemoryStatus(ctypes.Structure):
+            _fields_ = [("dwLength",ctypes.c_ulong),("dwMemoryLoad",ctypes.c_ulong),
+                    ("ullTotalPhys",ctypes.c_ulonglong),("ullAvailPhys",ctypes.c_ulonglong),
+                    ("ullTotalPageFile",ctypes.c_ulonglong),("ullAvailPageFile",ctypes.c_ulonglong),
+                    ("ullTotalVirtual",ctypes.c_ulonglong),("ullAvailVirtual",ctypes.c_ulonglong),
+                    ("ullAvailExtendedVirtual",ctypes.c_ulonglong)]
+
+        status = MemoryStatus()
+        status.dwLength = ctypes.sizeof(MemoryStatus)
+        if not ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(status)):
+            return None
+
+        #A 32 bit process is also bound by its address space
+        return int(min(status.ullAvailPhys,status.ullAvailVirtual))
+
+    try:
+        return int(os.sysconf("SC_AVPHYS_PAGES")*os.sysconf("SC_PAGE_SIZE"))
+    except (AttributeError,ValueError,OSError):
+        return None
+
+def UseTiles(shape,available=None):
+    """Should a volume of shape be filtered in tiles: do its WORKING_COPIES float32 copies take more than
+    MEMORY_FRACTION of the available memory (see GetAvailableMemory). If that is unknown, volumes whose
+    float32 copy is larger than TILE_BYTES are tiled."""
+    nbytes = int(np.prod(shape))*4
+    if available is None:
+        available = GetAvailableMemory()
+    if available is None:
+        return nbytes > TILE_BYTES
+    return nbytes*WORKING_COPIES > available*MEMORY_FRACTION
+
+def GetSharedBytes(available=None):
+    """The memory budget for the shared buffers of a BandpassPool.
+
+    SHARED_BYTES if set, otherwise half of MEMORY_FRACTION of the available
+    memory (the other half is left to the working copies of the workers), or
+    4*TILE_BYTES if that is unknown."""
+    if SHARED_BYTES is not None:
+        return SHARED_BYTES
+    if available is None:
+        available = GetAvailableMemory()
+    if available is None:
+        return 4*TILE_BYTES
+    return int(available*MEMORY_FRACTION) // 2
+
+def GetTileBytes(processes=None,available=None):
+    """The size of the largest float32 tile (halo included) when filtering in tiles.
+
+    The tiles filtered at the same time (one per process, see BandpassPool)
+    and their working copies take MEMORY_FRACTION of the available memory,
+    half of it with a pool, whose two slots per process must also fit in
+    GetSharedBytes. TILE_BYTES if the available memory is unknown."""
+    if processes is None:
+        processes = PROCESSES
+    processes = max(1,processes)
+
+    if available is None:
+        available = GetAvailableMemory()
+    if available is None:
+        max_bytes = TILE_BYTES
+    else:
+        copies = WORKING_COPIES*processes
+        if processes > 1:
+            copies *= 2
+        max_bytes = int(available*MEMORY_FRACTION) // copies
+
+    if processes > 1:
+        #Each slot holds an input and an output tile
+        max_bytes = min(max_bytes,GetSharedBytes(available) // (2*2*processes))
+    return max(1,max_bytes)
+
+def GetHalo(params):
+    """Number of voxels needed on each side of a tile for its band-pass to match that of the whole volume.
+    Smoothing step s (from 0 to high_scale-1) reaches the kernel radius times 2**s voxels further."""
+    kernel = libatrous.get_kernel(params[0])
+    return (len(kernel)//2)*(2**params[2]-1)
+
+def GetTileShape(shape,halo,max_bytes=None):
+    """A tile shape such that a float32 tile with its halo takes about max_bytes (GetTileBytes() by default) at most.
+    The largest side is halved until the tile fits, but the tiled sides are kept at least twice the halo
+    (smaller tiles would mostly filter their halo), so the tile may then take more than max_bytes."""
+    if max_bytes is None:
+        max_bytes = GetTileBytes()
+
+    tile = list(shape)
+    while True:
+        outer = [min(shape[i],tile[i]+2*halo) for i in range(len(shape))]
+        if np.prod(outer)*4 <= max_bytes:
+            break
+        i = int(np.argmax(tile))
+        if (tile[i]+1)//2 < max(1,2*halo):
+            break
+        tile[i] = (tile[i]+1)//2
+    return tuple(tile)
+
+def IterTiles(arr,tile,halo):
+    """Iterate over the tiles of an array and their halo (clipped at the array borders).
+    Yields (origin, core, tile) tuples, as BridgeLib.IterDataBlocks does for Imaris volumes."""
+    shape = arr.shape
+    nd = len(shape)
+    for p0 in itertools.product(*[range(0,shape[i],tile[i]) for i in range(nd)]):
+        p1 = [min(p0[i]+tile[i],shape[i]) for i in range(nd)]
+        h0 = [max(0,p0[i]-halo) for i in range(nd)]
+        h1 = [min(shape[i],p1[i]+halo) for i in range(nd)]
+        core = tuple([slice(p0[i]-h0[i],p1[i]-h0[i]) for i in range(nd)])
+        outer = tuple([slice(h0[i],h1[i]) for i in range(nd)])
+        yield tuple(h0),core,np.ascontiguousarray(arr[outer])
+
+def GetTiledBandpass(tiles,shape,params,out=None,pool=None):
+    """Band-pass filter a volume one tile at a time, with the same result as GetBandpass.
+
+    tiles is an iterable of (origin, core, tile) float32 tuples (see IterTiles
+    and BridgeLib.IterDataBlocks), with a halo of at least GetHalo(params)
+    voxels. The core of each filtered tile is copied to out (a float32 array
+    of the volume shape, allocated by default, possibly memory-mapped).
+    Only a tile and its intermediate scales are held in memory at any time,
+    or one per slot if a BandpassPool is given to filter the tiles in its
+    worker processes (its slots must hold the largest tile). Returns out."""
+    if out is None:
+        out = np.empty(shape,np.float32)
+
+    if pool is None:
+        filtered = (((origin,core),GetBandpass(tile,params)) for origin,core,tile in tiles)
+    else:
+        filtered = pool.imap((((origin,core),tile,params) for origin,core,tile in tiles))
+
+    for (origin,core),arr in filtered:
+        dst = tuple([slice(origin[i]+core[i].start,origin[i]+core[i].stop) for i in range(len(core))])
+        out[dst] = arr[core]
+    return out
+
+###########################################################################
+## Fast preview on decimated data
+###########################################################################
+def GetPreviewFactor(shape,max_bytes=None):
+    """The power of two by which X and Y are decimated so that a float32 volume of shape takes at most max_bytes (PREVIEW_BYTES by default).
+    X and Y are not decimated below 32 voxels."""
+    if max_bytes is None:
+        max_bytes = PREVIEW_BYTES
+
+    def GetSize(factor):
+        return list(shape[:-2])+[-(-shape[-2]//factor),-(-shape[-1]//factor)]
+
+    factor = 1
+    while np.prod(GetSize(factor))*4 > max_bytes and min(GetSize(2*factor)[-2:]) >= 32:
+        factor *= 2
+    return factor
+
+def Decimate(arr,factor):
+    """Mean of arr over factor x factor blocks in Y and X (the blocks at the far edges may be partial), as float32"""
+    for axis in (-2,-1):
+        n = arr.shape[axis]
+        starts = np.arange(0,n,factor)
+        counts = np.diff(np.append(starts,n)).astype(np.float32)
+        arr = np.add.reduceat(arr,starts,axis=axis,dtype=np.float32)
+        shape = [1]*arr.ndim
+        shape[axis] = -1
+        arr /= counts.reshape(shape)
+    return arr
+
+def Upsample(arr,factor,shape):
+    """Repeat each voxel of arr factor x factor times in Y and X, cropped to shape"""
+    for axis in (-2,-1):
+        arr = np.repeat(arr,factor,axis=axis)
+    return np.ascontiguousarray(arr[...,:shape[-2],:shape[-1]])
+
+def GetPreviewParams(params,factor):
+    """The band-pass parameters for data decimated by factor: the scales are lowered by log2(factor), to no less than 1"""
+    kernel_type,low_scale,high_scale,check_invert,check_lowpass = params
+    k = int(round(np.log2(factor)))
+    return (kernel_type,max(1,low_scale-k),max(1,high_scale-k),check_invert,check_lowpass)
+
+def GetPreviewBandpass(small,params,factor,grid,shape):
+    """An approximate band-pass of a volume of shape, from its decimated copy small (see Decimate).
+    grid is the (resx, resy, resz) voxel size of the full volume. Returns the result upsampled to shape."""
+    resx,resy,resz = grid
+    libatrous.set_grid(resx*factor,resy*factor,resz)
+    try:
+        atrous_sub = GetBandpass(small,GetPreviewParams(params,factor))
+    finally:
+        libatrous.set_grid(resx,resy,resz)
+    return Upsample(atrous_sub,factor,shape)
+
+###########################################################################
+## Process pool
+###########################################################################
+
+#In a worker process, the (inputs, outputs) shared buffers as flat arrays
+_worker_buffers = None
+
+def _AsArrays(buffers):
+    return [np.ctypeslib.as_array(raw) for raw in buffers]
+
+def _SlotArray(buffer,shape):
+    """The start of a flat slot buffer, as an array of shape"""
+    return buffer[:int(np.prod(shape))].reshape(shape)
+
+def _InitWorker(grid,inputs,outputs):
+    global _worker_buffers
+    libatrous.set_grid(*grid)
+    _worker_buffers = (_AsArrays(inputs),_AsArrays(outputs))
+
+def _BandpassJob(slot,shape,params):
+    inputs,outputs = _worker_buffers
+    _SlotArray(outputs[slot],shape)[...] = GetBandpass(_SlotArray(inputs[slot],shape),params)
+    return slot
+
+def GetPoolSlots(shape,processes=None):
+    """The number of slots of a BandpassPool (see below) for float32 volumes of shape.
+
+    Two per process, so that the next volumes are copied in while the workers
+    are busy, or as many as GetSharedBytes holds. A pool with fewer slots than
+    processes only starts one process per slot. 0 if that doesn't hold a
+    single volume, in which case the volumes are best filtered in the calling
+    process."""
+    if processes is None:
+        processes = PROCESSES
+    processes = max(1,processes)
+
+    nbytes = 2*int(np.prod(shape))*4
+    return min(2*processes,GetSharedBytes() // max(1,nbytes))
+
+class BandpassPool(object):
+    """Computes band-pass filtered volumes (see GetBandpass) in a pool of worker processes.
+
+    The volumes go to and come back from the workers through shared memory
+    buffers (one input and one output buffer per slot), only the slot number,
+    the volume shape and the filter parameters are pickled. The slots hold a
+    float32 volume of shape, or any smaller one (e.g. the tiles of a volume,
+    see GetTiledBandpass). The number of slots is given by GetPoolSlots by
+    default, there are no more processes than slots.
+    grid is the (resx, resy, resz) voxel size given to libatrous.set_grid.
+    """
+    def __init__(self,shape,grid,processes=None,slots=None):
+        if processes is None:
+            processes = PROCESSES
+        processes = max(1,processes)
+
+        if slots is None:
+            slots = GetPoolSlots(shape,processes)
+        if slots < 1:
+            raise ValueError("The shared memory can't hold a %s volume, filter it serially" % "x".join([str(n) for n in shape]))
+        processes = min(processes,slots)
+
+        self.shape = tuple(shape)
+        self.size = int(np.prod(shape))
+        self.processes = processes
+        self.slots = slots
+
+        inputs = [RawArray('f',self.size) for i in range(slots)]
+        outputs = [RawArray('f',self.size) for i in range(slots)]
+        self.inputs = _AsArrays(inputs)
+        self.outputs = _AsArrays(outputs)
+
+        self.pool = multiprocessing.Pool(processes,_InitWorker,(tuple(grid),inputs,outputs))
+
+    def imap(self,jobs):
+        """Filter the volumes of jobs, an iterable of (key, dataset, params) tuples.
+
+        Jobs are taken from the iterable as slots become free, so the next
+        datasets can be read while the workers are busy. Yields (key, result)
+        tuples in the order of jobs. A worker error is raised here."""
+        free = list(range(self.slots))
+        pending = collections.deque()
+
+        for key,dataset,params in jobs:
+            if dataset.size > self.size:
+                raise ValueError("a %s volume doesn't fit in the slots of the pool" % "x".join([str(n) for n in dataset.shape]))
+
+            if len(free) == 0:
+                yield self._Collect(pending.popleft(),free)
+
+            slot = free.pop()
+            _SlotArray(self.inputs[slot],dataset.shape)[...] = dataset
+            pending.append((key,slot,dataset.shape,self.pool.apply_async(_BandpassJob,(slot,dataset.shape,params))))
+
+        while len(pending) > 0:
+            yield self._Collect(pending.popleft(),free)
+
+    def _Collect(self,item,free):
+        key,slot,shape,result = item
+        result.get()
+        arr = _SlotArray(self.outputs[slot],shape).copy()
+        free.append(slot)
+        return key,arr
+
+    def close(self):
+        """Stop the worker processes"""
+        self.pool.terminate()
+        self.pool.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self,*args):
+        self.close()
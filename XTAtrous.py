@@ -1,434 +1,787 @@
-#
-#
-#  Atrous Python XTension  
-#
-#  Copyright (C) 2014 Egor Zindy <egor.zindy@manchester.ac.uk>, MIT license
-#
-#    <CustomTools>
-#      <Menu name = "Python plugins">
-#       <Item name="Wavelet analysis" icon="Python" tooltip="Wavelet analysis for Imaris (2D and 3D kernels).">
-#         <Command>PythonXT::XTAtrous(%i)</Command>
-#       </Item>
-#      </Menu>
-#    </CustomTools>
-#
-# 
-# Permission is hereby granted, free of charge, to any person obtaining a copy
-#  of this software and associated documentation files (the "Software"), to deal
-#  in the Software without restriction, including without limitation the rights
-#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
-#  copies of the Software, and to permit persons to whom the Software is
-#  furnished to do so, subject to the following conditions:
-# 
-# The above copyright notice and this permission notice shall be included in
-#  all copies or substantial portions of the Software.
-# 
-# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
-#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
-#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
-#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
-#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
-#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
-#  THE SOFTWARE.
-#
-# vim: set ts=4 sts=4 sw=4 expandtab smartindent:
-
-import hotswap
-import AtrousDialog
-import Tkinter as tk
-import ttk
-
-import ImarisLib
-import BridgeLib
-
-import time
-import numpy as np
-import libatrous
-
-###########################################################################
-## Main application module
-###########################################################################
-class MyModule:
-    def __init__(self,vImaris):
-        self.vImaris = vImaris
-
-        #Use a clone
-        self.vDataSet = vImaris.GetDataSet().Clone()
-
-        #Keep all these in memory
-        self.vdataset_nt = self.vDataSet.GetSizeT()
-        self.vdataset_nx = self.vDataSet.GetSizeX()
-        self.vdataset_ny = self.vDataSet.GetSizeY()
-        self.vdataset_nz = self.vDataSet.GetSizeZ()
-        self.vdataset_nc = self.vDataSet.GetSizeC()
-
-        resx, resy, resz = BridgeLib.GetVoxelSize(self.vDataSet)
-
-        #Setting the grid resolution
-        libatrous.set_grid(resx, resy, resz) 
-
-        self.wavelet_data = None
-
-        #The raw data (might take some time to load, so keep it in memory)
-        self.raw_data = None
-
-        #For now, only save the parameters for the current channel. When changing channel, this data is erased.
-        self.arrayvar_last = None
-
-        self.InitDialog()
-
-    def InitDialog(self):
-        #Build the dialog
-        self.Dialog=AtrousDialog.AtrousDialog()
-        self.Dialog.set_icon(BridgeLib.GetIcon())
-
-        self.Dialog.ExitOK = self.ExitOK
-        self.Dialog.ExitCancel = self.ExitCancel
-        self.Dialog.Update = self.Update
-        self.Dialog.Preview = self.Preview
-        self.Dialog.Calculate = self.Calculate
-
-        self.names = []
-        self.indexes = []
-        self.indexdic = {}
-
-        for i in range(self.vdataset_nc):
-            cname = self.vDataSet.GetChannelName(i)
-            if ' (filtered)' in cname:
-                continue
-            elif cname == '' or cname == '(name not specified)':
-                cname = 'Channel %d' % (i+1)
-                self.vDataSet.SetChannelName(i,cname)
-            self.names.append(cname)
-            self.indexes.append(i)
-            self.indexdic[cname] = i
-
-        self.current_channel = 0
-
-        #Set filters and current filter
-        self.Dialog.SetKernels(libatrous.get_names(),0)
-        #Set channels and current channel
-        self.Dialog.SetChannels(self.names,self.current_channel)
-        #Threshold scale
-        self.SetThresholdScales()
-
-        self.Dialog.mainloop()
-
-    def SetThresholdScales(self,channel=None):
-        #The threshold values
-        if channel is None:
-            channel = self.current_channel
-
-        michan = self.vDataSet.GetChannelRangeMin(channel)
-        machan = self.vDataSet.GetChannelRangeMax(channel)
-        self.Dialog.ctrl_low_thresh.config(from_=michan, to=machan,tickinterval=(machan-michan)/8.)
-        self.Dialog.ctrl_high_thresh.config(from_=michan, to=machan,tickinterval=(machan-michan)/8.)
-
-        self.Dialog.arrayvar["low_thresh"] =michan 
-        self.Dialog.arrayvar["high_thresh"] = machan
-
-    def GetUpdated(self,old,new):
-        """Check which parameters have changed between old and new dic"""
-        return [x for x in set(old) & set(new) if old[x] != new[x]]
-
-    def Update(self, arrayvar, elementname):
-        '''Show the new value in a label'''
-
-        if elementname == "channel": 
-            channel = self.indexdic[arrayvar[elementname]]
-            self.current_channel = channel
-
-            #Corresponding channel_out - Get any json information from its description
-            #We do not want to create a new channel at this point
-            channel_out = self.GetMatchedChannel(self.current_channel, create=False)
-            if channel_out != -1:
-                json = BridgeLib.GetChannelDescription(self.vDataSet,channel_out)
-                if json != "":
-                    self.Dialog.arrayvar.set_json(json)
-
-            self.arrayvar_last = None
-
-        elif elementname == "check_channel":
-            self.arrayvar_last = None
-
-        if 1:
-            pass
-            #any condition (for now)
-            #channel_out = self.GetMatchedChannel(self.current_channel)
-            #print("updating threshold",self.current_channel,channel_out,elementname)
-            #self.SetThresholdScales(channel_out)
-
-        #Do we need to preview?
-        if (arrayvar["check_liveview"] == "on"):
-            self.Preview()
-
-
-
-    def GetMatchedChannel(self,cindex,create=True):
-        """Finds the matched filtered channel for a particular channel index.
-        If none found and the keyword create is set to true, this method will create a new channel and return its new index"""
-
-        ret = -1
-        cname = self.vDataSet.GetChannelName(cindex)
-        nc = self.vDataSet.GetSizeC()
-        for i in range(nc):
-            name = self.vDataSet.GetChannelName(i)
-            if name == cname+" (filtered)":
-                ret = i
-                break
-
-        if create == True and ret == -1:
-            self.vDataSet.SetSizeC(nc+1)
-            ret = nc
-            self.vDataSet.SetChannelName(ret,cname+" (filtered)")
-            rgba = self.vDataSet.GetChannelColorRGBA(cindex)
-            #rgba = rgba ^ 0x00ffffff
-            self.vDataSet.SetChannelColorRGBA(ret,rgba)
-
-        return ret
-
-    def Calculate(self,preview=False):
-        """Bulk of the calculation
-        preview: current timepoint, otherwise, calculate all
-        when applying threshold: In preview, will leave visibility alone
-        otherwise, turn visibility off during data transfer to Imaris (faster)
-        """
-
-        #Check between last and current, what actually needs recomputing.
-        arrayvar = self.Dialog.arrayvar.get()
-        list_filters = libatrous.get_names()
-        kernel_type = list_filters.index(arrayvar["kernel_type"])
-        kernel = libatrous.get_kernel(kernel_type)
-
-        low_scale = int(arrayvar["low_scale"])
-        high_scale = int(arrayvar["high_scale"])
-        low_thresh = float(arrayvar["low_thresh"])
-        high_thresh = float(arrayvar["high_thresh"])
-        check_invert = (arrayvar["check_invert"] == "on")
-        check_lowpass = (arrayvar["check_lowpass"] == "on")
-        check_threshold = (arrayvar["check_threshold"] == "on")
-        #check_delete = (arrayvar["check_delete"] == "on")
-        check_normalise = (arrayvar["check_normalise"] == "on")
-        check_delete = False
-
-        #Two things we need to check. Do we need to update both wavelet and threshold
-        #Do we need to do one time point or all.
-        update_wavelet = False
-        update_threshold = False
-
-        #All the channels or just the current selected channel (from dropdown menu)
-        if self.Dialog.arrayvar["check_channel"] == "on":
-            channel_indexes = self.indexes
-        else:
-            channel_indexes = [self.current_channel]
-
-        #This is a sure sign that we have NOT done any calculations yet
-        if self.arrayvar_last is None:
-            update_wavelet = True
-            update_threshold = True
-            self.wavelet_data = {}
-            self.raw_data = {}
-
-        else:
-            changed = set(self.GetUpdated(self.arrayvar_last, arrayvar))
-            if set(["kernel_type", "check_invert", "check_lowpass", "low_scale", "high_scale"]) & changed:
-                update_wavelet = True
-                update_threshold = True
-            #elif set(["low_thresh", "high_thresh", "check_threshold", "check_delete", "check_normalise"]) & changed:
-            elif set(["low_thresh", "high_thresh", "check_threshold", "check_normalise"]) & changed:
-                update_threshold = True
-
-        #Do we need to update any of the wavelet data?
-        for channel in channel_indexes:
-            if channel not in self.wavelet_data.keys():
-                tps = range(self.vdataset_nt)
-
-                #Do the same thing both for the wavelet data and the raw data
-                self.raw_data[channel] = [None]*self.vdataset_nt
-                self.wavelet_data[channel] = [None]*self.vdataset_nt
-
-        #Now, this is where we define what the timepoints are. That depends on preview (single timepoint)
-        #Updating the preview keyword makes sure we only process one timepoint in preview
-        #... then process all the timepoints the second time round
-        if preview:
-            arrayvar["preview"] = True
-            tp = self.vImaris.GetVisibleIndexT()
-            tps = [tp]
-
-            # Here we test if simply seeking a new timepoint and checking the filter for that timepoint. Is a filtered image available?
-            if self.wavelet_data[channel][tp] is None:
-                update_wavelet = True
-                update_threshold = True
-        else:
-            arrayvar["preview"] = False
-            tps = range(self.vdataset_nt)
-
-        if self.arrayvar_last is not None and self.arrayvar_last["preview"]==True and preview==False:
-            update_wavelet = True
-            update_threshold = True
-
-        ############################################################
-        # Update the wavelet if needed
-        ############################################################
-        if update_wavelet:
-            miarr,maarr = None, None
-            for channel in channel_indexes:
-                michan,machan = BridgeLib.GetRange(self.vDataSet,channel)
-                for tp in tps:
-                    if self.raw_data[channel][tp] is not None:
-                        dataset = self.raw_data[channel][tp]
-                    else:
-                        if self.vdataset_nz == 1:
-                            dataset = BridgeLib.GetDataSlice(self.vDataSet,0,channel,tp).astype(np.float32)
-                        else:
-                            dataset = BridgeLib.GetDataVolume(self.vDataSet,channel,tp).astype(np.float32)
-                        if check_invert:
-                            dataset = machan - dataset
-
-                        self.raw_data[channel][tp] = dataset
-
-                    atrous_sub = libatrous.get_bandpass(dataset,low_scale-1,high_scale-1,kernel,check_lowpass)
-                    mi = np.min(atrous_sub)
-                    ma = np.max(atrous_sub)
-
-                    if miarr is None or mi < miarr:
-                        miarr = mi
-                    if maarr is None or ma > maarr:
-                        maarr = ma
-
-                    self.wavelet_data[channel][tp] = atrous_sub
-                    self.Dialog.ctrl_progress["value"]=(100.*(tp/float(len(tps)*len(channel_indexes))))
-                    self.Dialog.ctrl_progress.update()
-
-            time.sleep(0.2)
-            self.Dialog.ctrl_progress["value"]=0
-            self.Dialog.ctrl_progress.update()
-
-            self.Dialog.ctrl_low_thresh.config(from_=miarr, to=maarr,tickinterval=(maarr-miarr)/8.)
-            self.Dialog.ctrl_high_thresh.config(from_=miarr, to=maarr,tickinterval=(maarr-miarr)/8.)
-
-        ############################################################
-        # Update the threshold if needed
-        ############################################################
-        if update_threshold:
-            channel_visibility = []
-
-            if preview == False:
-                for i in range(self.vdataset_nc):
-                    channel_visibility.append(self.vImaris.GetChannelVisibility(i))
-                    self.vImaris.SetChannelVisibility(i,0)
-
-            i = 0
-            for channel in channel_indexes:
-                michan,machan = BridgeLib.GetRange(self.vDataSet,channel)
-                channel_out = self.GetMatchedChannel(channel)
-
-                #Update the channel description...
-                BridgeLib.SetChannelDescription(self.vDataSet,channel_out,self.Dialog.arrayvar.get_json())
-
-                for tp in tps:
-                    array_out  = self.wavelet_data[channel][tp].copy()
-                    miarr = array_out.min()
-                    maarr = array_out.max()
-
-                    #do threshold
-                    if check_threshold:
-                        mi, ma = low_thresh, high_thresh
-                    else:
-                        mi, ma = miarr, maarr
-
-                    if mi == ma:
-                        ma = mi + (maarr-miarr)/100.
-
-                    if check_delete:
-                        pass
-                        #array_out[array_out < mi] = mi
-                        #deleting objects brighter than max value
-                        #array_out[array_out > ma] = mi
-                    else:
-                        #we really don't want any hot background.
-                        if check_normalise:
-                            #when normalising, this isn't an issue as normalisation occurs after clipping.
-                            array_out[array_out < mi] = mi
-                        else:
-                            #Here, we are not normalising so values below the minimum value mi should be set to 0 rather than the mi value...
-                            #unless mi is itself below 0 (although that would be an odd thing to do, but still need to be accounted for).
-                            if mi < 0:
-                                zeromi = mi
-                            else:
-                                zeromi = 0
-
-                            array_out[array_out < mi] = zeromi
-
-                        array_out[array_out > ma] = ma
-
-                    #do normalisation
-                    mi = np.min(array_out)
-                    ma = np.max(array_out)
-                    if check_normalise:
-                        array_out = (machan-michan)*(array_out-mi)/(ma-mi)+michan
-                        mi = michan
-                        ma = machan
-
-                    #convert the data back to the original format...
-                    array_out = array_out.astype(BridgeLib.GetType(self.vDataSet))
-
-                    #push back
-                    if self.vdataset_nz == 1:
-                        BridgeLib.SetDataSlice(self.vDataSet,array_out,0,channel_out,tp)
-                    else:
-                        BridgeLib.SetDataVolume(self.vDataSet,array_out,channel_out,tp)
-
-                    self.vDataSet.SetChannelRange(channel_out,int(round(mi)),int(round(ma)))
-
-                    self.Dialog.ctrl_progress["value"]=(100.*(tp/float(len(tps)*len(channel_indexes))))
-                    self.Dialog.ctrl_progress.update()
-                    self.vImaris.SetDataSet(self.vDataSet)
-
-            if preview == False:
-                for i in range(self.vdataset_nc):
-                    self.vImaris.SetChannelVisibility(i,channel_visibility[i])
-
-            time.sleep(0.2)
-            self.Dialog.ctrl_progress["value"]=0
-            self.Dialog.ctrl_progress.update()
-
-            #Keeping the arrayvar values
-            self.arrayvar_last = arrayvar
-
-    def Preview(self):
-        self.Calculate(preview=True)
-
-    def ExitOK(self):
-        '''OK button action'''
-        self.Dialog.destroy()
-        exit(0)
-
-    def ExitCancel(self):
-        '''Cancel button action'''
-        self.Dialog.destroy()
-        exit(0)
-
-def XTAtrous(aImarisId):
-    # Create an ImarisLib object
-    vImarisLib = ImarisLib.ImarisLib()
-
-    # Get an imaris object with id aImarisId
-    vImaris = vImarisLib.GetApplication(aImarisId)
-
-    # Check if the object is valid
-    if vImaris is None:
-        print("Could not connect to Imaris!")
-        exit(1)
-
-    vDataSet = vImaris.GetDataSet()
-    if vDataSet is None:
-        print("No data available!")
-        exit(1)
-
-    #The hotswap module watcher...
-    _watcher = hotswap.ModuleWatcher()
-    _watcher.run()
-
-    aModule = MyModule(vImaris)
-
+#
+#
+#  Atrous Python XTension  
+#
+#  Copyright (C) 2014 Egor Zindy <egor.zindy@manchester.ac.uk>, MIT license
+#
+#    <CustomTools>
+#      <Menu name = "Python plugins">
+#       <Item name="Wavelet analysis" icon="Python" tooltip="Wavelet analysis for Imaris (2D and 3D kernels).">
+#         <Command>PythonXT::XTAtrous(%i)</Command>
+#       </Item>
+#      </Menu>
+#    </CustomTools>
+#
+# 
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to deal
+#  in the Software without restriction, including without limitation the rights
+#  to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+#  copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+# 
+# The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+#  OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+#  THE SOFTWARE.
+#
+# vim: set ts=4 sts=4 sw=4 expandtab smartindent:
+
+import hotswap
+import AtrousDialog
+import Tkinter as tk
+import ttk
+
+import ImarisLib
+import BridgeLib
+import ArrayLib
+import AtrousLib
+
+import numpy as np
+import libatrous
+
+###########################################################################
+## Processing pipeline
+###########################################################################
+class AtrousPipeline(object):
+    """Wavelet filtering of the channels of an Imaris dataset, thresholded into matching "(filtered)" channels.
+
+    Nothing in here uses the dialog, so the pipeline can run headless or on
+    a worker thread. progress(done, total) is called as each stage moves on
+    (from the thread running the pipeline), and timer has the time spent in
+    each stage (see ArrayLib.StageTimer). The wavelets are cached and only
+    the timepoints whose output changed are written back, so running again
+    with new parameters only does what these require.
+    """
+    def __init__(self,vDataSet,progress=None):
+        self.vDataSet = vDataSet
+        self.progress = progress
+
+        #Keep all these in memory
+        self.vdataset_nt = self.vDataSet.GetSizeT()
+        self.vdataset_nx = self.vDataSet.GetSizeX()
+        self.vdataset_ny = self.vDataSet.GetSizeY()
+        self.vdataset_nz = self.vDataSet.GetSizeZ()
+
+        resx, resy, resz = BridgeLib.GetVoxelSize(self.vDataSet)
+
+        #Setting the grid resolution
+        self.grid = (resx, resy, resz)
+        libatrous.set_grid(resx, resy, resz) 
+
+        #Worker processes for the wavelets of several timepoints, started when first needed
+        self.pool = None
+        self.serial_warned = False
+
+        #The raw data (might take some time to load) and wavelet data are kept in a byte-budgeted cache
+        #What doesn't fit in memory is spilled to disk
+        self.cache = BridgeLib.SpillCache()
+
+        #What was last pushed to each (output channel, timepoint)
+        self.pushed = {}
+
+        #Time spent in each stage
+        self.timer = ArrayLib.StageTimer()
+
+    def GetMatchedChannel(self,cindex,create=True):
+        """Finds the matched filtered channel for a particular channel index.
+        If none found and the keyword create is set to true, this method will create a new channel and return its new index"""
+
+        ret = -1
+        cname = self.vDataSet.GetChannelName(cindex)
+        nc = self.vDataSet.GetSizeC()
+        for i in range(nc):
+            name = self.vDataSet.GetChannelName(i)
+            if name == cname+" (filtered)":
+                ret = i
+                break
+
+        if create == True and ret == -1:
+            self.vDataSet.SetSizeC(nc+1)
+            ret = nc
+            self.vDataSet.SetChannelName(ret,cname+" (filtered)")
+            rgba = self.vDataSet.GetChannelColorRGBA(cindex)
+            #rgba = rgba ^ 0x00ffffff
+            self.vDataSet.SetChannelColorRGBA(ret,rgba)
+
+        return ret
+
+    def GetShape(self):
+        """The shape of the volumes (Z is dropped for 2-D datasets)"""
+        if self.vdataset_nz == 1:
+            return (self.vdataset_ny,self.vdataset_nx)
+        return (self.vdataset_nz,self.vdataset_ny,self.vdataset_nx)
+
+    def IsTiled(self):
+        """Are the volumes too large for the available memory, and filtered in tiles (see AtrousLib.UseTiles)"""
+        return AtrousLib.UseTiles(self.GetShape())
+
+    def GetRawData(self,channel,tp,check_invert,dataset=None):
+        """The (possibly inverted) float32 raw data for a channel and timepoint.
+        dataset is the volume if it was already fetched, otherwise it is read from the cache or from Imaris."""
+        key = self.GetRawKey(channel,tp,check_invert)
+        if dataset is None:
+            dataset = self.cache.get(key)
+            if dataset is not None:
+                return dataset
+            dataset = BridgeLib.GetDataVolume(self.vDataSet,channel,tp)
+
+        if self.vdataset_nz == 1:
+            dataset = dataset[0]
+        dataset = dataset.astype(np.float32)
+        if check_invert:
+            michan,machan = BridgeLib.GetRange(self.vDataSet,channel)
+            dataset = machan - dataset
+
+        self.cache.put(key,dataset)
+        return dataset
+
+    def IterRawTiles(self,channel,tp,check_invert,tile,halo):
+        """The tiles of the (possibly inverted) float32 raw data, read from Imaris one at a time (see BridgeLib.IterDataBlocks)"""
+        if self.vdataset_nz == 1:
+            block = (1,)+tuple(tile)
+            halo = (0,halo,halo)
+        else:
+            block = tile
+
+        if check_invert:
+            michan,machan = BridgeLib.GetRange(self.vDataSet,channel)
+
+        for origin,core,arr in BridgeLib.IterDataBlocks(self.vDataSet,channel,tp,block,halo):
+            arr = arr.astype(np.float32)
+            if check_invert:
+                arr = machan - arr
+            if self.vdataset_nz == 1:
+                origin,core,arr = origin[1:],core[1:],arr[0]
+            yield origin,core,arr
+
+    def GetRawKey(self,channel,tp,check_invert,factor=1):
+        if factor == 1:
+            return BridgeLib.CacheKey(self.vDataSet,channel,tp,"raw",check_invert)
+        return BridgeLib.CacheKey(self.vDataSet,channel,tp,"raw",check_invert,factor)
+
+    def GetDecimatedRawData(self,channel,tp,check_invert,factor,dataset=None):
+        """The raw data decimated by factor in X and Y (see AtrousLib.Decimate), for a fast preview.
+        Unless the raw data is already at hand, large volumes are read and decimated a few planes at a time."""
+        key = self.GetRawKey(channel,tp,check_invert,factor)
+        small = self.cache.get(key)
+        if small is not None:
+            return small
+
+        if dataset is None and self.IsTiled() and self.GetRawKey(channel,tp,check_invert) not in self.cache:
+            shape = self.GetShape()
+            small = np.empty(shape[:-2]+(-(-shape[-2]//factor),-(-shape[-1]//factor)),np.float32)
+
+            #Tiles are cut on the decimation blocks
+            tile = AtrousLib.GetTileShape(shape,0,AtrousLib.GetTileBytes(1))
+            tile = tile[:-2]+tuple([-(-n//factor)*factor for n in tile[-2:]])
+            for origin,core,arr in self.IterRawTiles(channel,tp,check_invert,tile,0):
+                arr = AtrousLib.Decimate(arr,factor)
+                origin = origin[:-2]+(origin[-2]//factor,origin[-1]//factor)
+                small[tuple([slice(origin[i],origin[i]+arr.shape[i]) for i in range(arr.ndim)])] = arr
+        else:
+            small = AtrousLib.Decimate(self.GetRawData(channel,tp,check_invert,dataset),factor)
+
+        self.cache.put(key,small)
+        return small
+
+    def GetWaveletKey(self,channel,tp,params,factor=1):
+        if factor == 1:
+            return BridgeLib.CacheKey(self.vDataSet,channel,tp,"wavelet",params)
+        return BridgeLib.CacheKey(self.vDataSet,channel,tp,"wavelet",params,factor)
+
+    def GetWavelet(self,channel,tp,params,dataset=None,factor=1):
+        """The band-pass filtered data for a channel and timepoint, from the cache or computed.
+        params is a (kernel_type, low_scale, high_scale, check_invert, check_lowpass) tuple.
+        If factor is more than 1, this is a fast approximation computed on data decimated by factor (see AtrousLib.GetPreviewBandpass)."""
+        key = self.GetWaveletKey(channel,tp,params,factor)
+        atrous_sub = self.cache.get(key)
+        if atrous_sub is None:
+            if factor > 1:
+                small = self.GetDecimatedRawData(channel,tp,params[3],factor,dataset)
+                atrous_sub = AtrousLib.GetPreviewBandpass(small,params,factor,self.grid,self.GetShape())
+            elif self.IsTiled():
+                atrous_sub = self.GetTiledWavelet(channel,tp,params,dataset)
+            else:
+                #Assembled from the detail planes, so that changing the scales doesn't filter the data again
+                dataset = self.GetRawData(channel,tp,params[3],dataset)
+                atrous_sub = AtrousLib.CombinePlanes(dataset,params,lambda scale: self.GetPlane(channel,tp,params,scale,dataset))
+            self.cache.put(key,atrous_sub)
+            self.ForgetPushed(key)
+        return atrous_sub
+
+    def ForgetPushed(self,key):
+        """A wavelet computed again replaces what was pushed from the previous one (the raw data may have changed)"""
+        for pushed_key in [pushed_key for pushed_key,state in self.pushed.items() if state[0] == key]:
+            del self.pushed[pushed_key]
+
+    def GetPlaneKey(self,channel,tp,params,scale):
+        kernel_type,low_scale,high_scale,check_invert,check_lowpass = params
+        return BridgeLib.CacheKey(self.vDataSet,channel,tp,"plane",kernel_type,check_invert,scale)
+
+    def GetPlane(self,channel,tp,params,scale,dataset):
+        """The sum of the detail planes from scale 1 to scale (see AtrousLib.CombinePlanes), from the cache or computed from the raw dataset"""
+        key = self.GetPlaneKey(channel,tp,params,scale)
+        plane = self.cache.get(key)
+        if plane is None:
+            plane = AtrousLib.GetBandpass(dataset,AtrousLib.GetPlaneParams(params,scale))
+            self.cache.put(key,plane)
+        return plane
+
+    def GetTiledWavelet(self,channel,tp,params,dataset=None):
+        """The band-pass filtered data, computed one tile at a time (see AtrousLib.GetTiledBandpass).
+        Unless the raw data is already at hand, it is read from Imaris one tile at a time.
+        The tiles are filtered in the worker processes, sized so that one per process fits in memory.
+        A result too large for the memory cache is written to a memory-mapped file instead."""
+        shape = self.GetShape()
+        halo = AtrousLib.GetHalo(params)
+        tile = AtrousLib.GetTileShape(shape,halo,AtrousLib.GetTileBytes())
+        check_invert = params[3]
+
+        if dataset is not None or self.GetRawKey(channel,tp,check_invert) in self.cache:
+            tiles = AtrousLib.IterTiles(self.GetRawData(channel,tp,check_invert,dataset),tile,halo)
+        else:
+            tiles = self.IterRawTiles(channel,tp,check_invert,tile,halo)
+
+        out = None
+        if np.prod(shape)*4 > self.cache.max_bytes:
+            out = self.cache.empty(shape,np.float32)
+
+        #The pool slots must hold the largest tile, halo included
+        pool = self.GetPool(tuple([min(shape[i],tile[i]+2*halo) for i in range(len(shape))]))
+        return AtrousLib.GetTiledBandpass(tiles,shape,params,out,pool)
+
+    def IterSlabs(self,arr):
+        """The Z slabs (rows for an image) of a volume, of about AtrousLib.GetTileBytes(1) each.
+        Yields (origin, slab) tuples, origin being the (z,y,x) position of the (sz,sy,sx) slab in the dataset."""
+        n = max(1,AtrousLib.GetTileBytes(1) // max(1,arr[0].nbytes))
+        for i in range(0,arr.shape[0],n):
+            slab = arr[i:i+n]
+            if self.vdataset_nz == 1:
+                yield (0,i,0),slab[np.newaxis]
+            else:
+                yield (i,0,0),slab
+
+    def GetPool(self,shape):
+        """The process pool computing the wavelets or their tiles (see AtrousLib.BandpassPool), None if AtrousLib.PROCESSES is 1 or less
+        or if AtrousLib.GetSharedBytes() can't hold a single volume of shape (the wavelets are then computed serially)"""
+        if AtrousLib.PROCESSES <= 1:
+            return None
+        if self.pool is None or self.pool.size < np.prod(shape):
+            if AtrousLib.GetPoolSlots(shape) == 0:
+                #Only say so the first time
+                if not self.serial_warned:
+                    print("Volumes of %s voxels are too large for the shared memory of the process pool, filtering them serially" % "x".join([str(n) for n in shape]))
+                    self.serial_warned = True
+                return None
+            self.ClosePool()
+            self.pool = AtrousLib.BandpassPool(shape,self.grid)
+        return self.pool
+
+    def ClosePool(self):
+        if self.pool is not None:
+            self.pool.close()
+            self.pool = None
+
+    def GetWaveletHistogram(self,channel,tp,params,atrous_sub=None,factor=1):
+        """The histogram of the wavelet data (see BridgeLib.GetHistogram), its range is read from there.
+        atrous_sub is the wavelet data if already at hand."""
+        key = self.GetWaveletKey(channel,tp,params,factor)
+        histogram = BridgeLib.SharedHistograms.get(key)
+        if histogram is None:
+            if atrous_sub is None:
+                atrous_sub = self.GetWavelet(channel,tp,params,factor=factor)
+            histogram = BridgeLib.GetHistogram(self.vDataSet,channel,tp,atrous_sub,key[3:])
+        return histogram
+
+    def GetWaveletSummary(self,channel_indexes,tps,params,factor=1):
+        """The histograms of the wavelets of tps merged into one (see ArrayLib.VolumeHistogram.merge), for the slider
+        range and threshold suggestions. The histograms of any other timepoint already in the index are merged in too."""
+        summary = ArrayLib.VolumeHistogram(np.float32)
+        for channel in channel_indexes:
+            for tp in range(self.vdataset_nt):
+                if tp in tps:
+                    histogram = self.GetWaveletHistogram(channel,tp,params,factor=factor)
+                else:
+                    histogram = BridgeLib.SharedHistograms.get(self.GetWaveletKey(channel,tp,params,factor))
+                if histogram is not None:
+                    summary.merge(histogram)
+        return summary
+
+    def Progress(self,done,total):
+        if self.progress is not None:
+            self.progress(done,total)
+
+    def UpdateWavelets(self,channel_indexes,tps,params,factor=1):
+        """Compute the wavelets of the channels and timepoints that are not in the cache yet.
+        params is a (kernel_type, low_scale, high_scale, check_invert, check_lowpass) tuple, factor is the decimation factor of a fast preview.
+        Returns the summary histogram of the wavelets (see GetWaveletSummary)."""
+        kernel_type,low_scale,high_scale,check_invert,check_lowpass = params
+        self.timer.start("wavelet")
+
+        #Only the wavelets not in the cache are computed. The raw data they need is fetched ahead
+        #(unless the volumes are filtered in tiles, in which case they are read tile by tile and the tiles go to the pool)
+        tiled = self.IsTiled()
+        todo = [(channel,tp) for channel in channel_indexes for tp in tps
+                if self.GetWaveletKey(channel,tp,params,factor) not in self.cache]
+        pairs = [(channel,tp) for channel,tp in todo
+                if self.GetRawKey(channel,tp,check_invert,factor) not in self.cache]
+        if tiled:
+            pairs = []
+        fetched = BridgeLib.PrefetchDataVolumes(self.vDataSet,pairs)
+        prefetched = set(pairs)
+
+        def GetInputs():
+            for channel,tp in todo:
+                dataset = None
+                if (channel,tp) in prefetched:
+                    pair,dataset = next(fetched)
+                yield (channel,tp),dataset
+
+        #Several wavelets are computed in worker processes, the progress follows their completion
+        pool = None
+        if len(todo) > 1 and not tiled and factor == 1:
+            pool = self.GetPool(self.GetShape())
+
+        if pool is None:
+            results = ((pair,self.GetWavelet(pair[0],pair[1],params,dataset,factor)) for pair,dataset in GetInputs())
+        else:
+            jobs = ((pair,self.GetRawData(pair[0],pair[1],check_invert,dataset),params) for pair,dataset in GetInputs())
+            results = pool.imap(jobs)
+
+        try:
+            i = 0
+            for (channel,tp),atrous_sub in results:
+                if pool is not None:
+                    self.cache.put(self.GetWaveletKey(channel,tp,params),atrous_sub)
+                    self.ForgetPushed(self.GetWaveletKey(channel,tp,params))
+
+                    #From scale 1 without the low-pass, this is also a detail plane
+                    if low_scale == 1 and not check_lowpass:
+                        self.cache.put(self.GetPlaneKey(channel,tp,params,high_scale),atrous_sub)
+                self.GetWaveletHistogram(channel,tp,params,atrous_sub,factor)
+
+                i += 1
+                self.Progress(i,len(todo))
+        except:
+            #Jobs may still be running in the pool, it can't be reused
+            self.ClosePool()
+            raise
+        finally:
+            #Stops the fetch threads, even if not all the volumes were used
+            fetched.close()
+
+        summary = self.GetWaveletSummary(channel_indexes,tps,params,factor)
+        self.timer.stop()
+        return summary
+
+    def UpdateThreshold(self,channel_indexes,tps,params,factor=1,thresholds=None,check_normalise=True,description=None):
+        """Threshold the wavelets into the output channels (created if needed) and push them back to the dataset.
+        thresholds is a (low, high) tuple, None for the range of the data. If check_normalise is set, the output
+        is normalised to the range of the input channel. description (the parameters) goes to the output channels.
+        Timepoints already showing the result are skipped. Returns the (output channel, timepoint) pairs written."""
+        self.timer.start("threshold")
+
+        dtype = BridgeLib.GetType(self.vDataSet)
+        pushed = {}
+
+        #Volumes are pushed back to Imaris while the next timepoint is processed
+        #(the queue is closed even if something goes wrong)
+        with BridgeLib.WriteQueue(self.vDataSet) as writer:
+            i = 0
+            n_ops = len(tps)*len(channel_indexes)
+            for channel in channel_indexes:
+                michan,machan = BridgeLib.GetRange(self.vDataSet,channel)
+
+                channel_out = self.GetMatchedChannel(channel,create=False)
+                if channel_out == -1:
+                    #A new output channel doesn't show anything pushed before
+                    channel_out = self.GetMatchedChannel(channel)
+                    for key in [key for key in self.pushed if key[0] == channel_out]:
+                        del self.pushed[key]
+
+                #Update the channel description...
+                if description is not None:
+                    BridgeLib.SetChannelDescription(self.vDataSet,channel_out,description)
+
+                for tp in tps:
+                    #The range of the wavelet comes from its histogram, no need to scan the data
+                    histogram = self.GetWaveletHistogram(channel,tp,params,factor=factor)
+                    miarr = histogram.min
+                    maarr = histogram.max
+
+                    #do threshold
+                    if thresholds is not None:
+                        mi, ma = thresholds
+                    else:
+                        mi, ma = miarr, maarr
+
+                    if mi == ma:
+                        ma = mi + (maarr-miarr)/100.
+
+                    #we really don't want any hot background.
+                    if check_normalise:
+                        #when normalising, this isn't an issue as normalisation occurs after clipping.
+                        zeromi = mi
+                    else:
+                        #Here, we are not normalising so values below the minimum value mi should be set to 0 rather than the mi value...
+                        #unless mi is itself below 0 (although that would be an odd thing to do, but still need to be accounted for).
+                        if mi < 0:
+                            zeromi = mi
+                        else:
+                            zeromi = 0
+
+                    #do normalisation. The range of the thresholded data follows from the range of the data
+                    mith,math = ArrayLib.GetThresholdRange(miarr,maarr,mi,ma,zeromi)
+                    if check_normalise:
+                        normalise = (mith,math,michan,machan)
+                        mith,math = michan,machan
+                    else:
+                        normalise = None
+
+                    #Timepoints already showing this result are not pushed again
+                    state = (self.GetWaveletKey(channel,tp,params,factor),mi,ma,zeromi,normalise)
+                    if self.pushed.get((channel_out,tp)) != state:
+                        #threshold, normalise and convert back to the original format in a single pass
+                        atrous_sub = self.GetWavelet(channel,tp,params,factor=factor)
+                        if self.IsTiled():
+                            #One slab at a time, the whole output is never held in memory
+                            for origin,slab in self.IterSlabs(atrous_sub):
+                                array_out = ArrayLib.Threshold(slab,mi,ma,zeromi,normalise,dtype,pool=ArrayLib.GetComputePool())
+                                writer.put_block(array_out,channel_out,tp,origin)
+                        else:
+                            array_out = ArrayLib.Threshold(atrous_sub,mi,ma,zeromi,normalise,dtype,pool=ArrayLib.GetComputePool())
+                            if self.vdataset_nz == 1:
+                                writer.put(array_out,channel_out,tp,0)
+                            else:
+                                writer.put(array_out,channel_out,tp)
+                        pushed[(channel_out,tp)] = state
+
+                    self.vDataSet.SetChannelRange(channel_out,int(round(mith)),int(round(math)))
+
+                    i += 1
+                    self.Progress(i,n_ops)
+
+            self.timer.start("write")
+            writer.close()
+
+        self.pushed.update(pushed)
+        self.timer.stop()
+        return list(pushed.keys())
+
+    def Run(self,channel_indexes,tps,params,factor=1,thresholds=None,check_normalise=True,description=None):
+        """Both stages, see UpdateWavelets and UpdateThreshold. Returns the summary histogram of the wavelets."""
+        self.timer = ArrayLib.StageTimer()
+        summary = self.UpdateWavelets(channel_indexes,tps,params,factor)
+        self.UpdateThreshold(channel_indexes,tps,params,factor,thresholds,check_normalise,description)
+        return summary
+
+###########################################################################
+## Main application module
+###########################################################################
+class MyModule:
+    def __init__(self,vImaris,Dialog=None):
+        #Without a Dialog, the Tk dialog is built. Otherwise, Dialog holds the parameters (see XTBatch.HeadlessDialog)
+        self.vImaris = vImaris
+
+        #Use a clone
+        self.vDataSet = vImaris.GetDataSet().Clone()
+
+        #Keep all these in memory
+        self.vdataset_nt = self.vDataSet.GetSizeT()
+        self.vdataset_nx = self.vDataSet.GetSizeX()
+        self.vdataset_ny = self.vDataSet.GetSizeY()
+        self.vdataset_nz = self.vDataSet.GetSizeZ()
+        self.vdataset_nc = self.vDataSet.GetSizeC()
+
+        #The computations, their progress is shown in the dialog
+        self.pipeline = AtrousPipeline(self.vDataSet,self.ShowProgress)
+
+        #For now, only save the parameters for the current channel. When changing channel, this data is erased.
+        self.arrayvar_last = None
+
+        if Dialog is None:
+            self.InitDialog()
+        else:
+            self.Dialog = Dialog
+            self.InitChannels()
+            self.current_channel = self.indexdic[self.Dialog.arrayvar["channel"]]
+
+    def InitDialog(self):
+        #Build the dialog
+        self.Dialog=AtrousDialog.AtrousDialog()
+        self.Dialog.set_icon(BridgeLib.GetIcon())
+
+        self.Dialog.ExitOK = self.ExitOK
+        self.Dialog.ExitCancel = self.ExitCancel
+        self.Dialog.Update = self.Update
+        self.Dialog.Preview = self.Preview
+        self.Dialog.Calculate = self.Calculate
+
+        self.InitChannels()
+
+        #Set filters and current filter
+        self.Dialog.SetKernels(libatrous.get_names(),0)
+        #Set channels and current channel
+        self.Dialog.SetChannels(self.names,self.current_channel)
+        #Threshold scale
+        self.SetThresholdScales()
+
+        self.Dialog.mainloop()
+
+    def InitChannels(self):
+        """The names and indexes of the channels that can be filtered"""
+        self.names = []
+        self.indexes = []
+        self.indexdic = {}
+
+        for i in range(self.vdataset_nc):
+            cname = self.vDataSet.GetChannelName(i)
+            if ' (filtered)' in cname:
+                continue
+            elif cname == '' or cname == '(name not specified)':
+                cname = 'Channel %d' % (i+1)
+                self.vDataSet.SetChannelName(i,cname)
+            self.names.append(cname)
+            self.indexes.append(i)
+            self.indexdic[cname] = i
+
+        self.current_channel = 0
+
+    def SetThresholdScales(self,channel=None):
+        #The threshold values
+        if channel is None:
+            channel = self.current_channel
+
+        michan = self.vDataSet.GetChannelRangeMin(channel)
+        machan = self.vDataSet.GetChannelRangeMax(channel)
+        self.Dialog.ctrl_low_thresh.config(from_=michan, to=machan,tickinterval=(machan-michan)/8.)
+        self.Dialog.ctrl_high_thresh.config(from_=michan, to=machan,tickinterval=(machan-michan)/8.)
+
+        self.Dialog.arrayvar["low_thresh"] =michan 
+        self.Dialog.arrayvar["high_thresh"] = machan
+
+    def ShowThresholdSuggestion(self,summary):
+        """Show Otsu's threshold for the wavelets (read from their summary histogram) next to the threshold sliders"""
+        text = ""
+        otsu = summary.otsu()
+        if otsu is not None:
+            text = "Otsu threshold %.1f" % otsu
+        self.Dialog.suggestvar.set(text)
+
+    def GetUpdated(self,old,new):
+        """Check which parameters have changed between old and new dic"""
+        return [x for x in set(old) & set(new) if old[x] != new[x]]
+
+    def Update(self, arrayvar, elementname):
+        '''Show the new value in a label'''
+
+        if elementname == "channel": 
+            channel = self.indexdic[arrayvar[elementname]]
+            self.current_channel = channel
+
+            #Corresponding channel_out - Get any json information from its description
+            #We do not want to create a new channel at this point
+            channel_out = self.pipeline.GetMatchedChannel(self.current_channel, create=False)
+            if channel_out != -1:
+                json = BridgeLib.GetChannelDescription(self.vDataSet,channel_out)
+                if json != "":
+                    self.Dialog.arrayvar.set_json(json)
+
+            self.arrayvar_last = None
+
+        elif elementname == "check_channel":
+            self.arrayvar_last = None
+
+        if 1:
+            pass
+            #any condition (for now)
+            #channel_out = self.GetMatchedChannel(self.current_channel)
+            #print("updating threshold",self.current_channel,channel_out,elementname)
+            #self.SetThresholdScales(channel_out)
+
+        #Do we need to preview? Live previews of large volumes are computed on decimated data
+        if (arrayvar["check_liveview"] == "on"):
+            self.Preview(fast=True)
+
+
+
+    def ShowProgress(self,done,total):
+        """Progress callback of the pipeline"""
+        self.Dialog.set_progress(100.*done/max(total,1))
+
+    def Calculate(self,preview=False,fast=False):
+        """Bulk of the calculation
+        preview: current timepoint, otherwise, calculate all
+        fast: in preview, filter a decimated copy of large volumes (see AtrousLib.GetPreviewFactor)
+        when applying threshold: In preview, will leave visibility alone
+        otherwise, turn visibility off during data transfer to Imaris (faster)
+        """
+
+        #Check between last and current, what actually needs recomputing.
+        arrayvar = self.Dialog.arrayvar.get()
+        list_filters = libatrous.get_names()
+        self.pipeline.timer = ArrayLib.StageTimer()
+        kernel_type = list_filters.index(arrayvar["kernel_type"])
+
+        low_scale = int(arrayvar["low_scale"])
+        high_scale = int(arrayvar["high_scale"])
+        low_thresh = float(arrayvar["low_thresh"])
+        high_thresh = float(arrayvar["high_thresh"])
+        check_invert = (arrayvar["check_invert"] == "on")
+        check_lowpass = (arrayvar["check_lowpass"] == "on")
+        check_threshold = (arrayvar["check_threshold"] == "on")
+        #check_delete = (arrayvar["check_delete"] == "on")
+        check_normalise = (arrayvar["check_normalise"] == "on")
+        check_delete = False
+
+        #The wavelet data is cached for these parameters
+        params = (kernel_type,low_scale,high_scale,check_invert,check_lowpass)
+
+        #... and decimation factor (fast preview only)
+        factor = 1
+        if preview and fast:
+            factor = AtrousLib.GetPreviewFactor(self.pipeline.GetShape())
+        arrayvar["factor"] = factor
+
+        #Two things we need to check. Do we need to update both wavelet and threshold
+        #Do we need to do one time point or all.
+        update_wavelet = False
+        update_threshold = False
+
+        #All the channels or just the current selected channel (from dropdown menu)
+        if self.Dialog.arrayvar["check_channel"] == "on":
+            channel_indexes = self.indexes
+        else:
+            channel_indexes = [self.current_channel]
+
+        #This is a sure sign that we have NOT done any calculations yet
+        if self.arrayvar_last is None:
+            update_wavelet = True
+            update_threshold = True
+
+        else:
+            changed = set(self.GetUpdated(self.arrayvar_last, arrayvar))
+            if set(["kernel_type", "check_invert", "check_lowpass", "low_scale", "high_scale"]) & changed:
+                update_wavelet = True
+                update_threshold = True
+            #elif set(["low_thresh", "high_thresh", "check_threshold", "check_delete", "check_normalise"]) & changed:
+            elif set(["low_thresh", "high_thresh", "check_threshold", "check_normalise"]) & changed:
+                update_threshold = True
+
+        #Now, this is where we define what the timepoints are. That depends on preview (single timepoint)
+        #Updating the preview keyword makes sure we only process one timepoint in preview
+        #... then process all the timepoints the second time round
+        if preview:
+            arrayvar["preview"] = True
+            tp = self.vImaris.GetVisibleIndexT()
+            tps = [tp]
+
+            # Here we test if simply seeking a new timepoint and checking the filter for that timepoint. Is a filtered image available?
+            if [channel for channel in channel_indexes if self.pipeline.GetWaveletKey(channel,tp,params,factor) not in self.pipeline.cache]:
+                update_wavelet = True
+                update_threshold = True
+        else:
+            arrayvar["preview"] = False
+            tps = range(self.vdataset_nt)
+
+        if self.arrayvar_last is not None and self.arrayvar_last["preview"]==True and preview==False:
+            update_wavelet = True
+            update_threshold = True
+
+        #Switching between a fast and a full resolution preview
+        if self.arrayvar_last is not None and self.arrayvar_last["factor"] != factor:
+            update_wavelet = True
+            update_threshold = True
+
+        ############################################################
+        # Update the wavelet if needed
+        ############################################################
+        if update_wavelet:
+            summary = self.pipeline.UpdateWavelets(channel_indexes,tps,params,factor)
+            self.Dialog.set_progress(0,redraw=True)
+
+            #The slider range covers all the wavelets, read from their histograms
+            miarr = summary.min
+            maarr = summary.max
+            if summary.total > 0:
+                self.Dialog.ctrl_low_thresh.config(from_=miarr, to=maarr,tickinterval=(maarr-miarr)/8.)
+                self.Dialog.ctrl_high_thresh.config(from_=miarr, to=maarr,tickinterval=(maarr-miarr)/8.)
+
+            #Otsu's threshold is shown as a suggestion, the sliders are left alone
+            self.ShowThresholdSuggestion(summary)
+
+        ############################################################
+        # Update the threshold if needed
+        ############################################################
+        if update_threshold:
+            channel_visibility = []
+
+            if preview == False:
+                for i in range(self.vdataset_nc):
+                    channel_visibility.append(self.vImaris.GetChannelVisibility(i))
+                    self.vImaris.SetChannelVisibility(i,0)
+
+            thresholds = None
+            if check_threshold:
+                thresholds = (low_thresh,high_thresh)
+
+            self.pipeline.UpdateThreshold(channel_indexes,tps,params,factor,thresholds,check_normalise,self.Dialog.arrayvar.get_json())
+
+            self.pipeline.timer.start("display")
+            self.vImaris.SetDataSet(self.vDataSet)
+            self.pipeline.timer.stop()
+
+            if preview == False:
+                for i in range(self.vdataset_nc):
+                    self.vImaris.SetChannelVisibility(i,channel_visibility[i])
+
+            self.Dialog.set_progress(0,redraw=True)
+
+            #Keeping the arrayvar values
+            self.arrayvar_last = arrayvar
+
+    def Preview(self,fast=False):
+        self.Calculate(preview=True,fast=fast)
+
+    def ExitOK(self):
+        '''OK button action'''
+        self.pipeline.ClosePool()
+        self.Dialog.destroy()
+        exit(0)
+
+    def ExitCancel(self):
+        '''Cancel button action'''
+        self.pipeline.ClosePool()
+        self.Dialog.destroy()
+        exit(0)
+
+def XTAtrous(aImarisId):
+    # Create an ImarisLib object
+    vImarisLib = ImarisLib.ImarisLib()
+
+    # Get an imaris object with id aImarisId
+    vImaris = vImarisLib.GetApplication(aImarisId)
+
+    # Check if the object is valid
+    if vImaris is None:
+        print("Could not connect to Imaris!")
+        exit(1)
+
+    vDataSet = vImaris.GetDataSet()
+    if vDataSet is None:
+        print("No data available!")
+        exit(1)
+
+    #The hotswap module watcher...
+    _watcher = hotswap.ModuleWatcher()
+    _watcher.run()
+
+    aModule = MyModule(vImaris)
+
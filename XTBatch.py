@@ -0,0 +1,226 @@
+# -*- coding: utf-8 -*-
+#
+#
+#  Batch processing for the Wavelet analysis (XTAtrous) and Channel Calculator (XTCalculator) XTensions.
+#  The filters run without their Tk dialog, on a list of files opened one after the other in Imaris:
+#
+#    python XTBatch.py -c settings.conf -o results/ data/*.ims
+#
+#  The settings are those saved by either dialog (File/Save configuration). Without a configuration
+#  file, they are read from the channel descriptions of each dataset (where the XTensions keep them).
+#
+# Copyright (c) 2018 Egor Zindy <egor.zindy@manchester.ac.uk>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# vim: set ts=4 sts=4 sw=4 expandtab smartindent:
+
+import argparse
+import json
+import os
+import sys
+import traceback
+
+import ImarisLib
+import BridgeLib
+import ArrayLib
+import XTAtrous
+import XTCalculator
+
+###########################################################################
+## Dialog stand-ins
+###########################################################################
+class HeadlessControl(object):
+    """Takes the place of a Tk widget: options are kept, redraws do nothing"""
+    def __init__(self):
+        self.options = {}
+
+    def __getitem__(self,key):
+        return self.options.get(key)
+
+    def __setitem__(self,key,value):
+        self.options[key] = value
+
+    def config(self,**kwargs):
+        self.options.update(kwargs)
+
+    def update(self):
+        pass
+
+class HeadlessVar(object):
+    """Takes the place of a Tk variable"""
+    def __init__(self,value=""):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+    def set(self,value):
+        self.value = value
+
+class HeadlessArrayVar(object):
+    """Takes the place of TkDialog.ArrayVar, the parameters are kept in a dictionary"""
+    def __init__(self):
+        self.values = {}
+
+    def __getitem__(self,name):
+        return self.values.get(name)
+
+    def __setitem__(self,name,value):
+        self.values[name] = value
+
+    def get(self):
+        return dict(self.values)
+
+    def get_json(self, indent=2, separators=(',', ': '),exclude=[]):
+        return json.dumps(self.get(), sort_keys=True, indent=indent, separators=separators)
+
+    def set_json(self,s,exclude=[]):
+        dic = json.loads(s)
+        for key in exclude+["menuitem"]:
+            dic.pop(key,None)
+        self.values.update(dic)
+
+class HeadlessDialog(object):
+    """Takes the place of an XTension dialog. config is the JSON string produced by ArrayVar.get_json"""
+    def __init__(self,config):
+        self.arrayvar = HeadlessArrayVar()
+        self.arrayvar.set_json(config)
+        self.thresholdvar = HeadlessVar()
+        self.suggestvar = HeadlessVar()
+
+    def set_progress(self,value,redraw=False):
+        self.ctrl_progress["value"] = value
+
+    def __getattr__(self,name):
+        #Any ctrl_xxx widget, created when first used
+        if name.startswith("ctrl_"):
+            control = HeadlessControl()
+            setattr(self,name,control)
+            return control
+        raise AttributeError(name)
+
+###########################################################################
+## Batch processing
+###########################################################################
+def GetModuleClass(config):
+    """The XTension module class for a configuration (a JSON string)"""
+    dic = json.loads(config)
+    if "kernel_type" in dic:
+        return XTAtrous.MyModule
+    elif "operation_type" in dic:
+        return XTCalculator.MyModule
+    raise ValueError("not an XTAtrous or XTCalculator configuration")
+
+def GetConfig(vDataSet):
+    """The first XTAtrous or XTCalculator configuration found in the channel descriptions of a dataset, None if there isn't any"""
+    for i in range(vDataSet.GetSizeC()):
+        s = BridgeLib.GetChannelDescription(vDataSet,i)
+        try:
+            GetModuleClass(s)
+        except ValueError:
+            continue
+        return s
+    return None
+
+def RunDataSet(vImaris,config):
+    """Filter the current dataset of vImaris with the parameters in config.
+    Returns the module, the time spent in each stage is in aModule.pipeline.timer"""
+    aModule = GetModuleClass(config)(vImaris,HeadlessDialog(config))
+    pipeline = aModule.pipeline
+    try:
+        aModule.Calculate()
+    finally:
+        if hasattr(pipeline,"ClosePool"):
+            pipeline.ClosePool()
+
+        #The next dataset may get the same identity, nothing can be kept
+        BridgeLib.SharedCache.invalidate(aModule.vDataSet)
+        BridgeLib.SharedHistograms.invalidate(aModule.vDataSet)
+        if pipeline.cache is not BridgeLib.SharedCache:
+            pipeline.cache.clear()
+
+    return aModule
+
+def GetOutputName(filename,output_dir=None,suffix="_batch"):
+    """The .ims file name a processed dataset is saved to"""
+    d,f = os.path.split(filename)
+    if output_dir is not None:
+        d = output_dir
+    return os.path.join(d,os.path.splitext(f)[0]+suffix+".ims")
+
+def RunBatch(vImaris,filenames,config=None,output_dir=None,suffix="_batch"):
+    """Open, filter and save each file in turn, reporting the time spent in each stage.
+    Without a config (JSON string), the configuration is read from the channel descriptions of each dataset.
+    A file that can't be processed is reported and skipped. Returns a list of (filename, StageTimer) tuples."""
+    results = []
+    total = ArrayLib.StageTimer()
+
+    for filename in filenames:
+        timer = ArrayLib.StageTimer()
+        try:
+            timer.start("open")
+            vImaris.FileOpen(filename,"")
+            s = config
+            if s is None:
+                s = GetConfig(vImaris.GetDataSet())
+                if s is None:
+                    raise ValueError("no configuration found in the channel descriptions")
+            timer.stop()
+
+            aModule = RunDataSet(vImaris,s)
+            for name,t in aModule.pipeline.timer.times.items():
+                timer.times[name] = timer.times.get(name,0.)+t
+
+            timer.start("save")
+            vImaris.FileSave(GetOutputName(filename,output_dir,suffix),'writer="Imaris5"')
+            timer.stop()
+        except Exception:
+            timer.stop()
+            print("%s: failed" % filename)
+            traceback.print_exc()
+            continue
+
+        print("%s: %s (%.3f s)" % (filename,timer,timer.total()))
+        for name,t in timer.times.items():
+            total.times[name] = total.times.get(name,0.)+t
+        results.append((filename,timer))
+
+    print("%d of %d file(s) processed: %s (%.3f s)" % (len(results),len(filenames),total,total.total()))
+    return results
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the XTAtrous or XTCalculator filters on a list of files, without their dialog.")
+    parser.add_argument("filenames",nargs="+",help="the files to process")
+    parser.add_argument("-i","--imaris-id",type=int,default=0,help="the id of the Imaris instance (default 0)")
+    parser.add_argument("-c","--config",help="a configuration file saved from the XTension dialog (default: read from the channel descriptions)")
+    parser.add_argument("-o","--output-dir",help="where the processed datasets are saved (default: next to the files)")
+    parser.add_argument("-s","--suffix",default="_batch",help="added to the name of the processed datasets (default _batch)")
+    args = parser.parse_args(argv)
+
+    vImarisLib = ImarisLib.ImarisLib()
+    vImaris = vImarisLib.GetApplication(args.imaris_id)
+    if vImaris is None:
+        print("Could not connect to Imaris!")
+        return 1
+
+    config = None
+    if args.config is not None:
+        config = open(args.config).read()
+        GetModuleClass(config)
+
+    RunBatch(vImaris,args.filenames,config,args.output_dir,args.suffix)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,430 +1,629 @@
-# -*- coding: utf-8 -*-
-#
-#
-#  Calculator Python XTension  
-#  Inspired by the ImageJ image calculator
-#
-#    <CustomTools>
-#      <Menu name = "Python plugins">
-#       <Item name="Channel Calculator" icon="Python" tooltip="Channel Calculator for Imaris.">
-#         <Command>PythonXT::XTCalculator(%i)</Command>
-#       </Item>
-#      </Menu>
-#    </CustomTools>
-#
-# 
-# Copyright (c) 2015 Egor Zindy <egor.zindy@manchester.ac.uk>
-#
-# Licensed under the Apache License, Version 2.0 (the "License");
-# you may not use this file except in compliance with the License.
-# You may obtain a copy of the License at
-#
-#     http://www.apache.org/licenses/LICENSE-2.0
-#
-# Unless required by applicable law or agreed to in writing, software
-# distributed under the License is distributed on an "AS IS" BASIS,
-# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
-# See the License for the specific language governing permissions and
-# limitations under the License.
-#
-# vim: set ts=4 sts=4 sw=4 expandtab smartindent:
-
-import CalculatorDialog
-import Tkinter as tk
-import ttk
-
-import ImarisLib
-import BridgeLib
-
-import time
-import numpy as np
-
-###########################################################################
-## Main application module
-###########################################################################
-class MyModule:
-    def __init__(self,vImaris):
-        self.vImaris = vImaris
-
-        #Use a clone
-        self.vDataSet = vImaris.GetDataSet().Clone()
-
-
-        #Keep all these in memory
-        self.vdataset_nt = self.vDataSet.GetSizeT()
-        self.vdataset_nx = self.vDataSet.GetSizeX()
-        self.vdataset_ny = self.vDataSet.GetSizeY()
-        self.vdataset_nz = self.vDataSet.GetSizeZ()
-        self.vdataset_nc = self.vDataSet.GetSizeC()
-
-        vdataset_resx = float(self.vDataSet.GetExtendMaxX()) / self.vdataset_nx
-        vdataset_resy = float(self.vDataSet.GetExtendMaxY()) / self.vdataset_ny
-        vdataset_resz = float(self.vDataSet.GetExtendMaxZ()) / self.vdataset_nz
-
-        #For now, only save the parameters for the current channel. When changing channel, this data is erased.
-        self.arrayvar_last = None
-        self.InitDialog()
-
-    def InitDialog(self):
-        #Build the dialog
-        self.Dialog=CalculatorDialog.Dialog()
-        self.Dialog.set_icon(BridgeLib.GetIcon())
-
-        self.Dialog.ExitOK = self.ExitOK
-        self.Dialog.ExitCancel = self.ExitCancel
-        self.Dialog.Update = self.Update
-        self.Dialog.Preview = self.Preview
-        self.Dialog.Calculate = self.Calculate
-
-        nc = self.vdataset_nc
-        self.names = []
-        self.indexes = []
-        self.indexdic = {}
-        self.operation_data = {}
-
-        for i in range(nc):
-            cname = self.vDataSet.GetChannelName(i)
-            if ' (masked)' in cname:
-                continue
-            elif cname == '' or cname == '(name not specified)':
-                cname = 'Channel %d' % (i+1)
-                self.vDataSet.SetChannelName(i,cname)
-            self.names.append(cname)
-            self.indexes.append(i)
-            self.indexdic[cname] = i
-
-        self.current_tp = self.vImaris.GetVisibleIndexT()
-        self.Dialog.SetChannels(self.names)# ,current_chan_a, current_chan_b)
-
-        #Check if we already have an output channel and if json info is contained in the description
-        output_channel = self.GetOutputChannel()
-        self.SetThresholdScales(output_channel)
-
-        json = BridgeLib.GetChannelDescription(self.vDataSet, output_channel)
-        if json != "":
-            self.Dialog.arrayvar.set_json(json)
-
-        self.Dialog.mainloop()
-
-
-    def SetThresholdScales(self,channel=None):
-        #The threshold values
-        if type(channel) == tuple or type(channel) == list:
-            michan = channel[0]
-            machan = channel[1]
-        else:
-            if channel is None or channel < 0:
-                channel = self.Dialog.arrayvar["chana_input"]
-
-            michan = self.vDataSet.GetChannelRangeMin(channel)
-            machan = self.vDataSet.GetChannelRangeMax(channel)
-
-        self.Dialog.ctrl_lothresh.config(from_=michan, to=machan,tickinterval=(machan-michan)/8.)
-        self.Dialog.ctrl_hithresh.config(from_=michan, to=machan,tickinterval=(machan-michan)/8.)
-
-        self.Dialog.arrayvar["lothresh"] =michan 
-        self.Dialog.arrayvar["hithresh"] = machan
-
-    def GetUpdated(self,old,new):
-        """Check which parameters have changed between old and new dic"""
-        return [x for x in set(old) & set(new) if old[x] != new[x]]
-
-    def Update(self, arrayvar, elementname):
-        '''Show the new value in a label'''
-
-        #Do we need to preview?
-        if (arrayvar["check_liveview"] == "on"):
-            self.Preview()
-
-    def GetOutputChannel(self,match="(calc)",create=False):
-        """Finds the output channel for this plugin.
-        If none found, this method will create a new channel and return its new index
-        In any case, channel name reflects channels and operation"""
-
-        arrayvar = self.Dialog.arrayvar.get()
-
-        ret = -1
-        nc = self.vDataSet.GetSizeC()
-        for i in range(nc):
-            name = self.vDataSet.GetChannelName(i)
-            if match in name:
-                ret = i
-                break
-
-        if ret == -1 and create == True:
-            self.vDataSet.SetSizeC(nc+1)
-            ret = nc
-
-            current_chan_a = self.Dialog.arrayvar["chana_input"]
-            current_chan_b = self.Dialog.arrayvar["chanb_input"]
-
-            try:
-                current_chan_a = self.indexdic[current_chan_a]
-                current_chan_b = self.indexdic[current_chan_b]
-            except:
-                print "channels A or B not available?"
-            else:
-                rgba = self.vDataSet.GetChannelColorRGBA(current_chan_a)
-                self.vDataSet.SetChannelColorRGBA(ret,rgba)
-
-            check_inverta = (arrayvar["check_inverta"] == "on")
-            check_invertb = (arrayvar["check_invertb"] == "on")
-
-            cname_a = self.vDataSet.GetChannelName(current_chan_a)
-            cname_b = self.vDataSet.GetChannelName(current_chan_b)
-
-            if check_inverta:
-                cname_a = "!"+cname_a
-
-            if check_invertb:
-                cname_b = "!"+cname_b
-
-            operation_name = arrayvar["operation_type"]
-            self.vDataSet.SetChannelName(ret,"%s(%s,%s) %s" % (operation_name,cname_a,cname_b,match))
-
-        return ret
-
-    def Calculate(self,preview=False):
-        """Bulk of the calculation
-        preview: current timepoint, otherwise, calculate all
-        when applying threshold: In preview, will leave visibility alone
-        otherwise, turn visibility off during data transfer to Imaris (faster)
-        """
-
-        update_operation = False
-
-        #Check between last and current, what actually needs recomputing.
-        arrayvar = self.Dialog.arrayvar.get()
-        lothresh = float(arrayvar["lothresh"])
-        hithresh = float(arrayvar["hithresh"])
-        check_inverta = (arrayvar["check_inverta"] == "on")
-        check_invertb = (arrayvar["check_invertb"] == "on")
-        check_threshold = (arrayvar["check_threshold"] == "on")
-        check_normalise = (arrayvar["check_normalise"] == "on")
-
-        current_chan_a = self.indexdic[arrayvar["chana_input"]]
-        current_chan_b = self.indexdic[arrayvar["chanb_input"]]
-
-        try:
-            factor_a = float(arrayvar["factor_a"])
-        except:
-            factor_a = 1.0
-
-        try:
-            factor_b = float(arrayvar["factor_b"])
-        except:
-            factor_b = 1.0
-
-        current_tp = self.vImaris.GetVisibleIndexT()
-
-        operation_type = CalculatorDialog.list_operations.index(arrayvar["operation_type"])
-
-        nt = self.vdataset_nt
-        nx = self.vdataset_nx
-        ny = self.vdataset_ny
-        nz = self.vdataset_nz
-        nc = self.vdataset_nc
-
-        #Two things we need to check. Do we need to update both operation and threshold
-        #Do we need to do one time point or all.
-
-        #This is a sure sign that we have NOT done any calculations yet
-        if self.arrayvar_last is None:
-            update_operation = True
-        else:
-            changed = set(self.GetUpdated(self.arrayvar_last, arrayvar))
-            if set(["factor_a","factor_b","operation_type","chana_input","chanb_input","check_inverta", "check_invertb"]) & changed:
-                update_operation = True
-
-        #Now, this is where we define what timepoints need updating. That depends on preview (single timepoint)
-        #Updating the preview keyword makes sure we only process one timepoint in preview
-        #... then process all the timepoints the second time round
-        if preview:
-            arrayvar["preview"] = True
-            tps = [current_tp]
-            if self.current_tp != current_tp:
-                self.current_tp = current_tp
-                if not current_tp in self.operation_data.keys():
-                    update_operation = True
-        else:
-            arrayvar["preview"] = False
-            tps = range(nt)
-            for tp in tps:
-                 if not tp in self.operation_data.keys():
-                     update_operation = True
-                     break
-
-        #The output channel is created if needed. In any case, the name will be updated (if needed)
-        channel_out = self.GetOutputChannel(create=True)
-
-        #Update the channel description...
-        print "Updating?"
-        BridgeLib.SetChannelDescription(self.vDataSet,channel_out,self.Dialog.arrayvar.get_json())
-
-        if preview == False:
-            channel_visibility = []
-            for i in range(nc):
-                channel_visibility.append(self.vImaris.GetChannelVisibility(i))
-                self.vImaris.SetChannelVisibility(i,0)
-
-        michan,machan = BridgeLib.GetRange(self.vDataSet)
-
-        n_ops = len(tps)
-        i = 0
-        ############################################################
-        # Update the operation if needed
-        ############################################################
-        if update_operation:
-            n_ops *= 2
-            #For each timepoint... First create the mask... then apply the mask to all the channels
-            miarr,maarr = None, None
-
-            mitp = None
-            matp = None
-            for tp in tps:
-                if nz == 1:
-                    array_a = BridgeLib.GetDataSlice(self.vDataSet,0,current_chan_a,tp).astype(float)
-                    array_b = BridgeLib.GetDataSlice(self.vDataSet,0,current_chan_b,tp).astype(float)
-                else:
-                    array_a = BridgeLib.GetDataVolume(self.vDataSet,current_chan_a,tp).astype(float)
-                    array_b = BridgeLib.GetDataVolume(self.vDataSet,current_chan_b,tp).astype(float)
-
-                if check_inverta:
-                    array_a = machan - array_a
-
-                if check_invertb:
-                    array_b = machan - array_b
-
-                array_a = array_a * factor_a
-                array_b = array_b * factor_b
-
-                if operation_type == 0: #Add
-                    array_op = array_a + array_b
-                elif operation_type == 1: #Subtract
-                    array_op = array_a - array_b
-                elif operation_type == 2: #Multiply
-                    array_op = array_a * array_b
-                elif operation_type == 3: #Divide
-                    array_op = array_a / array_b
-                else:
-                    array_op = np.zeros(array_a.shape)
-
-                #record the current operation data
-
-                array_op[array_op == np.inf] = michan
-                array_op[np.isnan(array_op)] = michan
-                array_op[array_op < michan] = michan
-                array_op[array_op > machan] = machan
-                self.operation_data[tp] = array_op
-                mi = np.min(array_op)
-                ma = np.max(array_op)
-                if mitp is None:
-                    mitp = mi
-                    matp = ma
-                elif mi < mitp:
-                    mitp = mi
-                elif ma > matp:
-                    matp = ma
-
-                #Update the progress bar
-                i+=1
-                self.Dialog.ctrl_progress["value"]=(100.*i)/n_ops
-                self.Dialog.ctrl_progress.update()
-
-            self.SetThresholdScales([mitp,matp])
-
-        #apply any threshold and get the data back to imaris
-        for tp in tps:
-            array_op = self.operation_data[tp].copy()
-            miarr = array_op.min()
-            maarr = array_op.max()
-
-            #do threshold
-            if check_threshold:
-                mi, ma = lothresh, hithresh
-            else:
-                mi, ma = miarr, maarr
-
-            if mi == ma:
-                if miarr != maarr:
-                    ma = mi + (maarr-miarr)/100.
-                else:
-                    ma = mi+1
-
-            if check_normalise:
-                #when normalising, this isn't an issue as normalisation occurs after clipping.
-                array_op[array_op < mi] = mi
-                array_op[array_op > ma] = ma
-            else:
-                #Here, we are not normalising so values below the minimum value mi should be set to 0 rather than the mi value...
-                #unless mi is itself below 0 (although that would be an odd thing to do, but still need to be accounted for).
-                if mi < 0:
-                    zeromi = mi
-                else:
-                    zeromi = 0
-
-                array_op[array_op < mi] = zeromi
-                array_op[array_op > ma] = ma
-
-            #do normalisation
-            if check_normalise:
-                mi = np.min(array_op)
-                ma = np.max(array_op)
-                array_op = (machan-michan)*(array_op-mi)/(ma-mi)+michan
-
-            #convert the data back to the original format...
-            array_op = array_op.astype(BridgeLib.GetType(self.vDataSet))
-
-            #push back
-            if nz == 1:
-                BridgeLib.SetDataSlice(self.vDataSet,array_op,0,channel_out,tp)
-            else:
-                BridgeLib.SetDataVolume(self.vDataSet,array_op,channel_out,tp)
-
-            #Update the progress bar
-            i+=1
-            self.Dialog.ctrl_progress["value"]=(100.*i)/n_ops
-            self.Dialog.ctrl_progress.update()
-
-        if preview == False:
-            for i in range(nc):
-                self.vImaris.SetChannelVisibility(i,channel_visibility[i])
-
-        #Keeping the arrayvar values
-        self.arrayvar_last = arrayvar
-        self.Dialog.ctrl_progress["value"]=0.
-        self.vImaris.SetDataSet(self.vDataSet)
-
-    def Preview(self):
-        self.Calculate(preview=True)
-
-    def ExitOK(self):
-        '''OK button action'''
-        self.Dialog.destroy()
-        exit(0)
-
-    def ExitCancel(self):
-        '''Cancel button action'''
-        self.Dialog.destroy()
-        exit(0)
-
-def XTCalculator(aImarisId):
-    # Create an ImarisLib object
-    vImarisLib = ImarisLib.ImarisLib()
-
-    # Get an imaris object with id aImarisId
-    vImaris = vImarisLib.GetApplication(aImarisId)
-
-    # Check if the object is valid
-    if vImaris is None:
-        print "Could not connect to Imaris!"
-        exit(1)
-
-    vDataSet = vImaris.GetDataSet()
-    if vDataSet is None:
-        print "No data available!"
-        exit(1)
-
-    aModule = MyModule(vImaris)
-
-
+# -*- coding: utf-8 -*-
+#
+#
+#  Calculator Python XTension  
+#  Inspired by the ImageJ image calculator
+#
+#    <CustomTools>
+#      <Menu name = "Python plugins">
+#       <Item name="Channel Calculator" icon="Python" tooltip="Channel Calculator for Imaris.">
+#         <Command>PythonXT::XTCalculator(%i)</Command>
+#       </Item>
+#      </Menu>
+#    </CustomTools>
+#
+# 
+# Copyright (c) 2015 Egor Zindy <egor.zindy@manchester.ac.uk>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# vim: set ts=4 sts=4 sw=4 expandtab smartindent:
+
+import CalculatorDialog
+import Tkinter as tk
+import ttk
+
+import ImarisLib
+import BridgeLib
+import ArrayLib
+
+###########################################################################
+## Processing pipeline
+###########################################################################
+class CalculatorPipeline(object):
+    """Channel arithmetic (see ArrayLib.Expression) on an Imaris dataset, thresholded into an output channel.
+
+    Nothing in here uses the dialog, so the pipeline can run headless or on
+    a worker thread. progress(done, total) is called as each stage moves on
+    (from the thread running the pipeline), and timer has the time spent in
+    each stage (see ArrayLib.StageTimer). The inputs and the results are
+    cached and only the timepoints whose output changed are written back.
+    """
+    def __init__(self,vDataSet,progress=None):
+        self.vDataSet = vDataSet
+        self.progress = progress
+        self.vdataset_nz = self.vDataSet.GetSizeZ()
+
+        #The channel inputs and the operation data are kept in a byte-budgeted cache, the operation (min, max) range in a dictionary
+        #The operation histograms are kept in BridgeLib.SharedHistograms
+        self.cache = BridgeLib.SharedCache
+        self.ranges = {}
+
+        #What was last pushed to the output channel, for each timepoint
+        self.pushed = {}
+
+        #Time spent in each stage
+        self.timer = ArrayLib.StageTimer()
+
+    def GetInputKey(self,channel,tp):
+        return BridgeLib.CacheKey(self.vDataSet,channel,tp)
+
+    def GetInput(self,channel,tp,fetched=None,prefetched=None):
+        """The raw volume for a channel and timepoint, from the cache, otherwise read from Imaris.
+        fetched is an optional iterator of ((channel, timepoint), volume) items, as returned by BridgeLib.PrefetchDataVolumes,
+        and prefetched the set of the pairs it has yet to yield. Only these are taken from it (and cached, up to the one
+        requested), any other volume is read directly. The array returned is shared, don't modify it."""
+        key = self.GetInputKey(channel,tp)
+        arr = self.cache.get(key)
+        if arr is not None:
+            return arr
+
+        if fetched is not None and (channel,tp) in prefetched:
+            for pair,arr in fetched:
+                prefetched.discard(pair)
+                self.cache.put(self.GetInputKey(*pair),arr)
+                if pair == (channel,tp):
+                    return arr
+
+        arr = BridgeLib.GetDataVolume(self.vDataSet,channel,tp)
+        self.cache.put(key,arr)
+        return arr
+
+    def GetOperationKey(self,tp,params):
+        #Writing to any of the channels of the expression invalidates the result (and its histogram)
+        channels = BridgeLib.DerivedChannels(sorted(set([channel for name,channel in params[1]])))
+        return BridgeLib.CacheKey(self.vDataSet,params[1][0][1],tp,"operation",params,channels)
+
+    def ComputeOperation(self,params,arrays,michan,machan):
+        """Evaluate the expression on the channel arrays, in float32, over the compute thread pool
+        inf and NaN become michan and the result is clipped to the michan,machan range.
+        Returns the result and its min and max, measured in the same pass."""
+        expression = ArrayLib.Expression(params[0])
+        return expression.evaluate(arrays,lo=michan,hi=machan,pool=ArrayLib.GetComputePool(),return_range=True)
+
+    def GetOperation(self,tp,params,michan,machan,fetched=None,prefetched=None):
+        """The operation data for a timepoint and its (min, max) range, from the cache or computed.
+        When computed, the histogram of the data is also kept (see BridgeLib.GetHistogram).
+        params is a (text, bindings) tuple as returned by MyModule.GetExpression.
+        fetched and prefetched are passed on to GetInput, the channel volumes are otherwise taken from the cache or read from Imaris."""
+        key = self.GetOperationKey(tp,params)
+        array_op = self.cache.get(key)
+        if array_op is None or key not in self.ranges:
+            arrays = dict([(name,self.GetInput(channel,tp,fetched,prefetched)) for name,channel in params[1]])
+
+            if self.vdataset_nz == 1:
+                arrays = dict([(name,arr[0]) for name,arr in arrays.items()])
+
+            array_op,mi,ma = self.ComputeOperation(params,arrays,michan,machan)
+            self.cache.put(key,array_op)
+            self.ranges[key] = (mi,ma)
+            BridgeLib.GetHistogram(self.vDataSet,params[1][0][1],tp,array_op,key[3:],lo=michan,hi=machan)
+
+            #A result computed again replaces what was pushed from the previous one (an input may have changed)
+            for pushed_tp in [pushed_tp for pushed_tp,state in self.pushed.items() if state[1] == key]:
+                del self.pushed[pushed_tp]
+        return array_op,self.ranges[key]
+
+    def Progress(self,done,total):
+        if self.progress is not None:
+            self.progress(done,total)
+
+    def UpdateOperation(self,tps,params,michan,machan,threshold=None):
+        """Compute the operation for the timepoints that are not in the cache yet.
+        params is a (text, bindings) tuple (see MyModule.GetExpression), the results are clipped to the michan,machan range.
+        threshold(tp, array_op, (mi, ma)) is optionally called with the operation data of each timepoint (see Run).
+        Returns the (min, max) range of the operation over tps."""
+        self.timer.start("operation")
+
+        #Only the timepoints not in the cache are computed, and only the inputs not in the cache are read from Imaris.
+        #The next ones are fetched ahead, while the current one is processed
+        pairs = []
+        for tp in tps:
+            if self.GetOperationKey(tp,params) in self.cache:
+                continue
+            for name,channel in params[1]:
+                if (channel,tp) not in pairs and self.GetInputKey(channel,tp) not in self.cache:
+                    pairs.append((channel,tp))
+        fetched = BridgeLib.PrefetchDataVolumes(self.vDataSet,pairs,ahead=2*len(params[1]))
+        prefetched = set(pairs)
+
+        try:
+            i = 0
+            mitp = None
+            matp = None
+            for tp in tps:
+                array_op,(mi,ma) = self.GetOperation(tp,params,michan,machan,fetched,prefetched)
+                if threshold is not None:
+                    threshold(tp,array_op,(mi,ma))
+
+                if mitp is None or mi < mitp:
+                    mitp = mi
+                if matp is None or ma > matp:
+                    matp = ma
+
+                i+=1
+                self.Progress(i,len(tps))
+        finally:
+            #Stops the fetch threads, even if not all the volumes were used
+            fetched.close()
+
+        self.timer.stop()
+        return mitp,matp
+
+    def UpdateThreshold(self,tps,params,michan,machan,channel_out,thresholds=None,check_normalise=True):
+        """Threshold the operation into channel_out and push it back to the dataset.
+        thresholds is a (low, high) tuple, None for the range of the data. If check_normalise is set, the output
+        is normalised to the michan,machan range. Timepoints already showing the result are skipped.
+        Returns the timepoints written."""
+        self.timer.start("threshold")
+
+        pushed = {}
+        i = 0
+
+        #Volumes are pushed back to Imaris while the next timepoint is processed
+        #(the queue is closed even if something goes wrong)
+        with BridgeLib.WriteQueue(self.vDataSet) as writer:
+            #apply any threshold and get the data back to imaris
+            for tp in tps:
+                array_op,op_range = self.GetOperation(tp,params,michan,machan)
+                state = self.ThresholdTimepoint(writer,tp,params,array_op,op_range,michan,machan,channel_out,thresholds,check_normalise)
+                if state is not None:
+                    pushed[tp] = state
+
+                i+=1
+                self.Progress(i,len(tps))
+
+            self.timer.start("write")
+            writer.close()
+
+        self.pushed.update(pushed)
+        self.timer.stop()
+        return list(pushed.keys())
+
+    def ThresholdTimepoint(self,writer,tp,params,array_op,op_range,michan,machan,channel_out,thresholds,check_normalise):
+        """Threshold the operation data of a timepoint (its range is op_range) and queue it in writer (see UpdateThreshold).
+        Returns the state of channel_out once written, None if the timepoint already shows this result."""
+        dtype = BridgeLib.GetType(self.vDataSet)
+        miarr,maarr = op_range
+
+        #do threshold
+        if thresholds is not None:
+            mi, ma = thresholds
+        else:
+            mi, ma = miarr, maarr
+
+        if mi == ma:
+            if miarr != maarr:
+                ma = mi + (maarr-miarr)/100.
+            else:
+                ma = mi+1
+
+        if check_normalise:
+            #when normalising, this isn't an issue as normalisation occurs after clipping.
+            zeromi = mi
+
+            #The range of the clipped data follows from the range of the data, no need to scan it again
+            normalise = (min(max(miarr,mi),ma),min(max(maarr,mi),ma),michan,machan)
+        else:
+            #Here, we are not normalising so values below the minimum value mi should be set to 0 rather than the mi value...
+            #unless mi is itself below 0 (although that would be an odd thing to do, but still need to be accounted for).
+            if mi < 0:
+                zeromi = mi
+            else:
+                zeromi = 0
+            normalise = None
+
+        #Timepoints already showing this result are not pushed again
+        state = (channel_out,self.GetOperationKey(tp,params),mi,ma,zeromi,normalise)
+        if self.pushed.get(tp) == state:
+            return None
+
+        #threshold, normalise and convert back to the original format in a single pass
+        array_out = ArrayLib.Threshold(array_op,mi,ma,zeromi,normalise,dtype,pool=ArrayLib.GetComputePool())
+        if self.vdataset_nz == 1:
+            writer.put(array_out,channel_out,tp,0)
+        else:
+            writer.put(array_out,channel_out,tp)
+        return state
+
+    def Run(self,tps,params,michan,machan,channel_out,thresholds=None,check_normalise=True):
+        """Both stages (see UpdateOperation and UpdateThreshold) in a single pass: each timepoint is thresholded
+        and pushed as soon as its operation is computed. The results of a series larger than the cache would
+        otherwise be evicted before the threshold stage, and computed again. Returns the (min, max) range of the operation."""
+        pushed = {}
+
+        with BridgeLib.WriteQueue(self.vDataSet) as writer:
+            def threshold(tp,array_op,op_range):
+                self.timer.start("threshold")
+                state = self.ThresholdTimepoint(writer,tp,params,array_op,op_range,michan,machan,channel_out,thresholds,check_normalise)
+                if state is not None:
+                    pushed[tp] = state
+                self.timer.start("operation")
+
+            mi,ma = self.UpdateOperation(tps,params,michan,machan,threshold)
+            self.timer.start("write")
+            writer.close()
+
+        self.pushed.update(pushed)
+        self.timer.stop()
+        return mi,ma
+
+###########################################################################
+## Main application module
+###########################################################################
+class MyModule:
+    def __init__(self,vImaris,Dialog=None):
+        #Without a Dialog, the Tk dialog is built. Otherwise, Dialog holds the parameters (see XTBatch.HeadlessDialog)
+        self.vImaris = vImaris
+
+        #Use a clone
+        self.vDataSet = vImaris.GetDataSet().Clone()
+
+
+        #Keep all these in memory
+        self.vdataset_nt = self.vDataSet.GetSizeT()
+        self.vdataset_nx = self.vDataSet.GetSizeX()
+        self.vdataset_ny = self.vDataSet.GetSizeY()
+        self.vdataset_nz = self.vDataSet.GetSizeZ()
+        self.vdataset_nc = self.vDataSet.GetSizeC()
+
+        vdataset_resx = float(self.vDataSet.GetExtendMaxX()) / self.vdataset_nx
+        vdataset_resy = float(self.vDataSet.GetExtendMaxY()) / self.vdataset_ny
+        vdataset_resz = float(self.vDataSet.GetExtendMaxZ()) / self.vdataset_nz
+
+        #For now, only save the parameters for the current channel. When changing channel, this data is erased.
+        self.arrayvar_last = None
+
+        #The computations, their progress is shown in the dialog
+        self.pipeline = CalculatorPipeline(self.vDataSet,self.ShowProgress)
+        self.params_last = None
+
+        if Dialog is None:
+            self.InitDialog()
+        else:
+            self.Dialog = Dialog
+            self.InitChannels()
+
+    def InitDialog(self):
+        #Build the dialog
+        self.Dialog=CalculatorDialog.Dialog()
+        self.Dialog.set_icon(BridgeLib.GetIcon())
+
+        self.Dialog.ExitOK = self.ExitOK
+        self.Dialog.ExitCancel = self.ExitCancel
+        self.Dialog.Update = self.Update
+        self.Dialog.Preview = self.Preview
+        self.Dialog.Calculate = self.Calculate
+
+        self.InitChannels()
+        self.Dialog.SetChannels(self.names)# ,current_chan_a, current_chan_b)
+
+        #Check if we already have an output channel and if json info is contained in the description
+        output_channel = self.GetOutputChannel()
+        self.SetThresholdScales(output_channel)
+
+        json = BridgeLib.GetChannelDescription(self.vDataSet, output_channel)
+        if json != "":
+            self.Dialog.arrayvar.set_json(json)
+
+        self.Dialog.mainloop()
+
+    def InitChannels(self):
+        """The names and indexes of the input channels"""
+        nc = self.vdataset_nc
+        self.names = []
+        self.indexes = []
+        self.indexdic = {}
+
+        for i in range(nc):
+            cname = self.vDataSet.GetChannelName(i)
+            if ' (masked)' in cname:
+                continue
+            elif cname == '' or cname == '(name not specified)':
+                cname = 'Channel %d' % (i+1)
+                self.vDataSet.SetChannelName(i,cname)
+            self.names.append(cname)
+            self.indexes.append(i)
+            self.indexdic[cname] = i
+
+        self.current_tp = self.vImaris.GetVisibleIndexT()
+
+    def SetThresholdScales(self,channel=None):
+        #The threshold values
+        if type(channel) == tuple or type(channel) == list:
+            michan = channel[0]
+            machan = channel[1]
+        else:
+            if channel is None or channel < 0:
+                channel = self.Dialog.arrayvar["chana_input"]
+
+            michan = self.vDataSet.GetChannelRangeMin(channel)
+            machan = self.vDataSet.GetChannelRangeMax(channel)
+
+        self.Dialog.ctrl_lothresh.config(from_=michan, to=machan,tickinterval=(machan-michan)/8.)
+        self.Dialog.ctrl_hithresh.config(from_=michan, to=machan,tickinterval=(machan-michan)/8.)
+
+        self.Dialog.arrayvar["lothresh"] =michan 
+        self.Dialog.arrayvar["hithresh"] = machan
+
+    def GetUpdated(self,old,new):
+        """Check which parameters have changed between old and new dic"""
+        return [x for x in set(old) & set(new) if old[x] != new[x]]
+
+    def Update(self, arrayvar, elementname):
+        '''Show the new value in a label'''
+
+        if elementname in ["lothresh","hithresh"]:
+            self.ShowThresholdInfo()
+
+        #Do we need to preview?
+        if (arrayvar["check_liveview"] == "on"):
+            self.Preview()
+
+    def ShowThresholdInfo(self):
+        """Show the percentage of voxels between the thresholds at the visible timepoint.
+        This only reads the histogram of the last operation computed, the voxels are not scanned."""
+        text = ""
+        if self.params_last is not None:
+            params,michan,machan = self.params_last
+            histogram = BridgeLib.SharedHistograms.get(self.pipeline.GetOperationKey(self.vImaris.GetVisibleIndexT(),params))
+            if histogram is not None and histogram.total > 0:
+                lothresh = float(self.Dialog.arrayvar["lothresh"])
+                hithresh = float(self.Dialog.arrayvar["hithresh"])
+                text = "%.1f%%" % (100.*histogram.count(lothresh,hithresh)/histogram.total)
+        self.Dialog.thresholdvar.set(text)
+
+    def GetOutputChannel(self,match="(calc)",create=False):
+        """Finds the output channel for this plugin.
+        If none found, this method will create a new channel and return its new index
+        In any case, channel name reflects channels and operation"""
+
+        arrayvar = self.Dialog.arrayvar.get()
+
+        ret = -1
+        nc = self.vDataSet.GetSizeC()
+        for i in range(nc):
+            name = self.vDataSet.GetChannelName(i)
+            if match in name:
+                ret = i
+                break
+
+        if ret == -1 and create == True:
+            self.vDataSet.SetSizeC(nc+1)
+            ret = nc
+
+            current_chan_a = self.Dialog.arrayvar["chana_input"]
+            current_chan_b = self.Dialog.arrayvar["chanb_input"]
+
+            try:
+                current_chan_a = self.indexdic[current_chan_a]
+                current_chan_b = self.indexdic[current_chan_b]
+            except:
+                print "channels A or B not available?"
+            else:
+                rgba = self.vDataSet.GetChannelColorRGBA(current_chan_a)
+                self.vDataSet.SetChannelColorRGBA(ret,rgba)
+
+            check_inverta = (arrayvar["check_inverta"] == "on")
+            check_invertb = (arrayvar["check_invertb"] == "on")
+
+            cname_a = self.vDataSet.GetChannelName(current_chan_a)
+            cname_b = self.vDataSet.GetChannelName(current_chan_b)
+
+            if check_inverta:
+                cname_a = "!"+cname_a
+
+            if check_invertb:
+                cname_b = "!"+cname_b
+
+            operation_name = arrayvar["operation_type"]
+            if operation_name == "Expression":
+                self.vDataSet.SetChannelName(ret,"%s %s" % (arrayvar["expression"],match))
+            else:
+                self.vDataSet.SetChannelName(ret,"%s(%s,%s) %s" % (operation_name,cname_a,cname_b,match))
+
+        return ret
+
+    def GetExpression(self,arrayvar,machan):
+        """The operation as a channel expression (see ArrayLib.Expression)
+        Returns a (text, bindings) tuple, bindings being the (variable, channel index) pairs used by the expression.
+        Raises a ValueError if the expression is invalid."""
+        operation_name = arrayvar["operation_type"]
+
+        if operation_name == "Expression":
+            #A, B, C... are the channels in the order of the channel lists
+            text = arrayvar["expression"]
+            expression = ArrayLib.Expression(text)
+            if len(expression.variables) == 0:
+                raise ValueError("the expression must use at least one channel")
+
+            bindings = []
+            for name in expression.variables:
+                index = ord(name)-ord('A')
+                if index >= len(self.indexes):
+                    raise ValueError("there is no channel %s" % name)
+                bindings.append((name,self.indexes[index]))
+        else:
+            #Build the expression from the A and B channels, their invert tick boxes and factors
+            terms = []
+            for name in ["a","b"]:
+                term = name.upper()
+                if arrayvar["check_invert"+name] == "on":
+                    term = "(%r-%s)" % (float(machan),term)
+
+                try:
+                    factor = float(arrayvar["factor_"+name])
+                except:
+                    factor = 1.0
+
+                if factor != 1:
+                    term = "%r*%s" % (factor,term)
+                terms.append(term)
+
+            operation_type = CalculatorDialog.list_operations.index(operation_name)
+            text = "(%s)%s(%s)" % (terms[0],"+-*/"[operation_type],terms[1])
+            bindings = [("A",self.indexdic[arrayvar["chana_input"]]),("B",self.indexdic[arrayvar["chanb_input"]])]
+
+        return text,tuple(bindings)
+
+    def ShowProgress(self,done,total):
+        """Progress callback of the pipeline"""
+        self.Dialog.set_progress(100.*done/max(total,1))
+
+    def Calculate(self,preview=False):
+        """Bulk of the calculation
+        preview: current timepoint, otherwise, calculate all
+        when applying threshold: In preview, will leave visibility alone
+        otherwise, turn visibility off during data transfer to Imaris (faster)
+        """
+
+        update_operation = False
+
+        #Check between last and current, what actually needs recomputing.
+        arrayvar = self.Dialog.arrayvar.get()
+        self.pipeline.timer = ArrayLib.StageTimer()
+        lothresh = float(arrayvar["lothresh"])
+        hithresh = float(arrayvar["hithresh"])
+        check_threshold = (arrayvar["check_threshold"] == "on")
+        check_normalise = (arrayvar["check_normalise"] == "on")
+
+        current_tp = self.vImaris.GetVisibleIndexT()
+
+        nt = self.vdataset_nt
+        nx = self.vdataset_nx
+        ny = self.vdataset_ny
+        nz = self.vdataset_nz
+        nc = self.vdataset_nc
+
+        michan,machan = BridgeLib.GetRange(self.vDataSet)
+
+        #The operation data is cached for this expression and channels
+        try:
+            params = self.GetExpression(arrayvar,machan)
+        except ValueError as e:
+            print "Invalid operation: %s" % e
+            return
+
+        #Two things we need to check. Do we need to update both operation and threshold
+        #Do we need to do one time point or all.
+
+        #This is a sure sign that we have NOT done any calculations yet
+        if self.arrayvar_last is None:
+            update_operation = True
+        else:
+            changed = set(self.GetUpdated(self.arrayvar_last, arrayvar))
+            if set(["factor_a","factor_b","operation_type","expression","chana_input","chanb_input","check_inverta", "check_invertb"]) & changed:
+                update_operation = True
+
+        #Now, this is where we define what timepoints need updating. That depends on preview (single timepoint)
+        #Updating the preview keyword makes sure we only process one timepoint in preview
+        #... then process all the timepoints the second time round
+        if preview:
+            arrayvar["preview"] = True
+            tps = [current_tp]
+            if self.current_tp != current_tp:
+                self.current_tp = current_tp
+                if self.pipeline.GetOperationKey(current_tp,params) not in self.pipeline.cache:
+                    update_operation = True
+        else:
+            arrayvar["preview"] = False
+            tps = range(nt)
+            for tp in tps:
+                 if self.pipeline.GetOperationKey(tp,params) not in self.pipeline.cache:
+                     update_operation = True
+                     break
+
+        #The output channel is created if needed. In any case, the name will be updated (if needed)
+        channel_out = self.GetOutputChannel(create=True)
+
+        #Update the channel description...
+        print "Updating?"
+        BridgeLib.SetChannelDescription(self.vDataSet,channel_out,self.Dialog.arrayvar.get_json())
+
+        if preview == False:
+            channel_visibility = []
+            for i in range(nc):
+                channel_visibility.append(self.vImaris.GetChannelVisibility(i))
+                self.vImaris.SetChannelVisibility(i,0)
+
+        ############################################################
+        # Update the operation if needed
+        ############################################################
+        #apply any threshold and get the data back to imaris
+        thresholds = None
+        if check_threshold:
+            thresholds = (lothresh,hithresh)
+
+        #A new operation is thresholded as it is computed, otherwise only the threshold stage is needed
+        if update_operation:
+            self.SetThresholdScales(self.pipeline.Run(tps,params,michan,machan,channel_out,thresholds,check_normalise))
+        else:
+            self.pipeline.UpdateThreshold(tps,params,michan,machan,channel_out,thresholds,check_normalise)
+
+        if preview == False:
+            for i in range(nc):
+                self.vImaris.SetChannelVisibility(i,channel_visibility[i])
+
+        #Keeping the arrayvar values
+        self.arrayvar_last = arrayvar
+        self.params_last = (params,michan,machan)
+        self.ShowThresholdInfo()
+        self.Dialog.set_progress(0,redraw=True)
+
+        self.pipeline.timer.start("display")
+        self.vImaris.SetDataSet(self.vDataSet)
+        self.pipeline.timer.stop()
+
+    def Preview(self):
+        self.Calculate(preview=True)
+
+    def ExitOK(self):
+        '''OK button action'''
+        self.Dialog.destroy()
+        exit(0)
+
+    def ExitCancel(self):
+        '''Cancel button action'''
+        self.Dialog.destroy()
+        exit(0)
+
+def XTCalculator(aImarisId):
+    # Create an ImarisLib object
+    vImarisLib = ImarisLib.ImarisLib()
+
+    # Get an imaris object with id aImarisId
+    vImaris = vImarisLib.GetApplication(aImarisId)
+
+    # Check if the object is valid
+    if vImaris is None:
+        print "Could not connect to Imaris!"
+        exit(1)
+
+    vDataSet = vImaris.GetDataSet()
+    if vDataSet is None:
+        print "No data available!"
+        exit(1)
+
+    aModule = MyModule(vImaris)
+
+
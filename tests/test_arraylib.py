@@ -0,0 +1,274 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2018 Egor Zindy <egor.zindy@manchester.ac.uk>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# vim: set ts=4 sts=4 sw=4 expandtab smartindent:
+
+"""ArrayLib kernels checked against plain NumPy references"""
+
+import numpy as np
+import pytest
+
+import ArrayLib
+
+from multiprocessing.pool import ThreadPool
+
+@pytest.fixture(scope="module")
+def pool():
+    pool = ThreadPool(3)
+    yield pool
+    pool.close()
+    pool.join()
+
+def RandomVolume(shape,lo,hi,dtype=np.float32,seed=0):
+    rng = np.random.RandomState(seed)
+    return (lo+(hi-lo)*rng.random_sample(shape)).astype(dtype)
+
+###########################################################################
+## ClipCast
+###########################################################################
+def test_clipcast_rounds_and_clips():
+    arr = np.array([-3.2,0.4,0.5,1.5,2.5,2.6,254.4,254.6,300.],np.float32)
+    out = ArrayLib.ClipCast(arr,np.uint8,chunk=4)
+    ref = np.clip(np.rint(arr),0,255).astype(np.uint8)
+    assert out.dtype == np.uint8
+    np.testing.assert_array_equal(out,ref)
+
+def test_clipcast_integer_source():
+    arr = np.array([-70000,-1,0,1000,65535,70000],np.int32)
+    out = ArrayLib.ClipCast(arr,np.uint16)
+    np.testing.assert_array_equal(out,np.clip(arr,0,65535).astype(np.uint16))
+
+def test_clipcast_non_contiguous():
+    arr = RandomVolume((6,10,8),-50,300).transpose(2,0,1)
+    out = ArrayLib.ClipCast(arr,np.uint8,chunk=37)
+    np.testing.assert_array_equal(out,np.clip(np.rint(arr),0,255).astype(np.uint8))
+
+
+def test_clipcast_out():
+    arr = RandomVolume((4,5,6),-50,300)
+    copy = arr.copy()
+    out = np.empty(arr.shape,np.uint16)
+    assert ArrayLib.ClipCast(arr,np.uint16,out=out) is out
+    np.testing.assert_array_equal(arr,copy)
+    with pytest.raises(ValueError):
+        ArrayLib.ClipCast(arr,np.uint8,out=out)
+
+###########################################################################
+## Inf / NaN scrub and clamp
+###########################################################################
+def SanitizeReference(arr,lo,hi):
+    ref = np.array(arr)
+    ref[~np.isfinite(ref)] = lo
+    return np.clip(ref,lo,hi)
+
+def DirtyVolume(shape):
+    arr = RandomVolume(shape,-200,200)
+    arr.reshape(-1)[::7] = np.inf
+    arr.reshape(-1)[1::11] = -np.inf
+    arr.reshape(-1)[2::13] = np.nan
+    return arr
+
+def test_sanitize_in_place(pool):
+    for p in (None,pool):
+        arr = DirtyVolume((5,9,8))
+        ref = SanitizeReference(arr,-100.,150.)
+        out,mi,ma = ArrayLib.SanitizeRange(arr,-100.,150.,chunk=17,pool=p)
+        assert out is arr
+        np.testing.assert_array_equal(arr,ref)
+        assert (mi,ma) == (ref.min(),ref.max())
+
+def test_sanitize_out(pool):
+    arr = DirtyVolume((5,9,8)).transpose(1,2,0)
+    copy = arr.copy()
+    ref = SanitizeReference(arr,-100.,150.)
+    for p in (None,pool):
+        out = np.empty(arr.shape,np.float32)
+        out,mi,ma = ArrayLib.SanitizeRange(arr,-100.,150.,out,chunk=17,pool=p)
+        np.testing.assert_array_equal(out,ref)
+        np.testing.assert_array_equal(arr,copy)
+        assert (mi,ma) == (ref.min(),ref.max())
+
+###########################################################################
+## Threshold
+###########################################################################
+def ThresholdReference(arr,lo,hi,below,normalise,dtype):
+    t = np.where(arr < lo,below,np.minimum(arr,hi)).astype(np.float64)
+    if normalise is not None:
+        in_lo,in_hi,out_lo,out_hi = normalise
+        t = (t-in_lo)*(out_hi-out_lo)/float(in_hi-in_lo)+out_lo
+    dtype = np.dtype(dtype)
+    if dtype.kind in 'ui':
+        t = np.rint(np.clip(t,*ArrayLib.GetTypeRange(dtype)))
+    return t.astype(dtype)
+
+@pytest.mark.parametrize("below,normalise",[(None,None),(0.,None),(0.,(10.,200.,0.,255.))])
+def test_threshold(below,normalise):
+    arr = RandomVolume((5,12,10),-20,250)
+    ref = ThresholdReference(arr,10.,200.,10. if below is None else below,normalise,np.uint8)
+    out = ArrayLib.Threshold(arr,10.,200.,below,normalise,np.uint8,chunk=50)
+    np.testing.assert_array_equal(out,ref)
+
+def test_threshold_pool(pool):
+    arr = RandomVolume((5,12,10),-20,250)
+    serial = ArrayLib.Threshold(arr,10.,200.,0.,(10.,200.,0.,65535.),np.uint16,chunk=50)
+    pooled = ArrayLib.Threshold(arr,10.,200.,0.,(10.,200.,0.,65535.),np.uint16,chunk=50,pool=pool)
+    np.testing.assert_array_equal(pooled,serial)
+
+@pytest.mark.parametrize("mi,ma",[(-20.,250.),(15.,120.),(-20.,5.),(220.,250.)])
+def test_threshold_range(mi,ma):
+    arr = np.linspace(mi,ma,101).astype(np.float32)
+    for below in (None,0.):
+        out = ArrayLib.Threshold(arr,10.,200.,below)
+        assert ArrayLib.GetThresholdRange(mi,ma,10.,200.,below) == (out.min(),out.max())
+
+###########################################################################
+## VolumeHistogram
+###########################################################################
+def PercentileReference(arr,q):
+    """The smallest value with at least q percent of the values at or below it"""
+    s = np.sort(arr,axis=None)
+    return s[max(0,int(np.ceil(q/100.*s.shape[0]))-1)]
+
+def OtsuReference(arr):
+    """Brute-force Otsu threshold: the value maximising the between-class variance of the values at or below it and those above it"""
+    a = arr.ravel().astype(np.float64)
+    best,best_value = -1.,None
+    for t in np.unique(a)[:-1]:
+        c0,c1 = a[a <= t],a[a > t]
+        between = c0.shape[0]*c1.shape[0]*(c0.mean()-c1.mean())**2
+        if between > best:
+            best,best_value = between,t
+    return best_value
+
+def Bimodal(n,dtype,seed=0):
+    rng = np.random.RandomState(seed)
+    arr = np.concatenate([rng.normal(60,10,n//2),rng.normal(170,15,n-n//2)])
+    return np.clip(np.rint(arr),0,255).astype(dtype)
+
+def test_histogram_exact():
+    arr = Bimodal(1000,np.uint8)
+    histogram = ArrayLib.VolumeHistogram(arr.dtype).add(arr,chunk=64)
+    np.testing.assert_array_equal(histogram.counts,np.bincount(arr,minlength=256))
+    assert (histogram.total,histogram.min,histogram.max) == (arr.size,arr.min(),arr.max())
+    for q in (0,1,10,50,90,99.5,100):
+        assert histogram.percentile(q) == PercentileReference(arr,q)
+    assert histogram.otsu() == OtsuReference(arr)
+    assert histogram.count(50,100) == np.count_nonzero((arr >= 50) & (arr <= 100))
+
+def test_histogram_merge_exact():
+    arr = Bimodal(2000,np.uint16)
+    merged = ArrayLib.VolumeHistogram(arr.dtype).add(arr[:700])
+    merged.merge(ArrayLib.VolumeHistogram(arr.dtype).add(arr[700:]))
+    whole = ArrayLib.VolumeHistogram(arr.dtype).add(arr)
+    np.testing.assert_array_equal(merged.counts,whole.counts)
+    assert (merged.total,merged.min,merged.max) == (whole.total,whole.min,whole.max)
+    assert merged.otsu() == whole.otsu()
+
+def test_histogram_merge_binned():
+    arr = Bimodal(4000,np.float32)+RandomVolume((4000,),-0.5,0.5)
+    arr[::97] = np.nan
+
+    #Two histograms over different ranges, merged into a third one
+    first = ArrayLib.VolumeHistogram(arr.dtype).add(arr[arr < 100])
+    second = ArrayLib.VolumeHistogram(arr.dtype).add(arr[arr >= 100])
+    merged = ArrayLib.VolumeHistogram(arr.dtype).merge(first).merge(second)
+
+    finite = arr[np.isfinite(arr)]
+    assert merged.total == finite.size
+    assert (merged.min,merged.max) == (finite.min(),finite.max())
+
+    #Re-binning by bin centre moves a value by a bin of either histogram at most
+    tolerance = 2*max(first.width,second.width,merged.width)
+    for q in (1,10,25,75,90,99):
+        assert abs(merged.percentile(q)-np.percentile(finite,q)) <= tolerance
+    assert abs(merged.otsu()-OtsuReference(finite)) <= 2*tolerance
+
+def test_histogram_fixed_range():
+    arr = Bimodal(3000,np.float32)+RandomVolume((3000,),-0.5,0.5)
+    histogram = ArrayLib.VolumeHistogram(arr.dtype,bins=1024,lo=-10.,hi=265.)
+    histogram.add(arr,chunk=100)
+    assert abs(histogram.otsu()-OtsuReference(arr)) <= 2*histogram.width
+    for q in (10,25,75,90):
+        assert abs(histogram.percentile(q)-np.percentile(arr,q)) <= histogram.width
+
+###########################################################################
+## Expression
+###########################################################################
+@pytest.mark.parametrize("text",["A +","A.b","foo(A)","a+1","min(A)","A if B else C","'A'"])
+def test_expression_invalid(text):
+    with pytest.raises(ValueError):
+        ArrayLib.Expression(text)
+
+def test_expression_parse():
+    expression = ArrayLib.Expression("(A*1.2 - B) / max(C, 2*3-5) + abs(-B)")
+    assert expression.variables == ["A","B","C"]
+
+    #2*3-5 is folded into a constant, each other operator and function is a step.
+    #Registers are reused once read, two are enough here
+    assert len(expression.plan) == 7
+    assert expression.nregisters == 2
+
+def test_expression_evaluate():
+    rng = np.random.RandomState(1)
+    arrays = {
+        "A": rng.randint(0,65536,(4,9,7)).astype(np.uint16),
+        "B": rng.randint(0,256,(4,9,7)).astype(np.uint8),
+        "C": RandomVolume((4,9,7),-5,5),
+    }
+    A,B,C = [arrays[name].astype(np.float32) for name in "ABC"]
+    ref = (A*np.float32(1.2)-B)/np.maximum(C,np.float32(1))+np.sqrt(B)
+
+    out = ArrayLib.Expression("(A*1.2 - B) / max(C, 1) + sqrt(B)").evaluate(arrays,chunk=40)
+    assert out.dtype == np.float32 and out.shape == (4,9,7)
+    np.testing.assert_allclose(out,ref,rtol=1e-6)
+
+def test_expression_constant():
+    out = np.empty((2,3),np.float32)
+    ArrayLib.Expression("2**3 - 1").evaluate({},out)
+    np.testing.assert_array_equal(out,7.)
+
+def test_expression_missing_channel():
+    with pytest.raises(ValueError):
+        ArrayLib.Expression("A+B").evaluate({"A": np.zeros(3,np.float32)})
+
+@pytest.mark.parametrize("shape",[(7,13,11),(1,13,11),(13,11)])
+def test_expression_pool(pool,shape):
+    arrays = {"A": RandomVolume(shape,0,100,seed=2),"B": RandomVolume(shape,1,10,seed=3)}
+    expression = ArrayLib.Expression("log(A+1)*B - A/B")
+    serial = expression.evaluate(arrays,chunk=10)
+    pooled = expression.evaluate(arrays,chunk=10,pool=pool)
+    np.testing.assert_array_equal(pooled,serial)
+
+def test_expression_sanitize_range():
+    arrays = {"A": RandomVolume((3,5,4),-10,10),"B": np.zeros((3,5,4),np.float32)}
+    arrays["B"][1] = 2.
+
+    #Divisions by zero give inf and NaN values, replaced by lo
+    out,mi,ma = ArrayLib.Expression("A/B").evaluate(arrays,lo=-2.,hi=3.,chunk=7,return_range=True)
+    with np.errstate(all='ignore'):
+        ref = arrays["A"]/arrays["B"]
+    ref[~np.isfinite(ref)] = -2.
+    ref = np.clip(ref,-2.,3.)
+    np.testing.assert_array_equal(out,ref)
+    assert (mi,ma) == (ref.min(),ref.max())
+
+def test_expression_pool_range(pool):
+    arrays = {"A": RandomVolume((7,13,11),0,100,seed=2),"B": RandomVolume((7,13,11),-1,10,seed=3)}
+    expression = ArrayLib.Expression("A/B")
+    serial,smi,sma = expression.evaluate(arrays,lo=-50.,hi=50.,chunk=10,return_range=True)
+    pooled,pmi,pma = expression.evaluate(arrays,lo=-50.,hi=50.,chunk=10,pool=pool,return_range=True)
+    np.testing.assert_array_equal(pooled,serial)
+    assert (pmi,pma) == (smi,sma) == (serial.min(),serial.max())
@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2018 Egor Zindy <egor.zindy@manchester.ac.uk>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# vim: set ts=4 sts=4 sw=4 expandtab smartindent:
+
+"""AtrousLib checks, those filtering volumes are skipped without libatrous"""
+
+import numpy as np
+import pytest
+
+import AtrousLib
+
+needs_libatrous = pytest.mark.skipif(AtrousLib.libatrous is None,reason="libatrous is not installed")
+
+def test_pool_slots(monkeypatch):
+    shape = (5,12,10)
+    nbytes = 2*5*12*10*4
+
+    monkeypatch.setattr(AtrousLib,"SHARED_BYTES",100*nbytes)
+    assert AtrousLib.GetPoolSlots(shape,3) == 6
+
+    #Fewer slots than processes, the pool then starts one process per slot
+    monkeypatch.setattr(AtrousLib,"SHARED_BYTES",2*nbytes)
+    assert AtrousLib.GetPoolSlots(shape,3) == 2
+
+    monkeypatch.setattr(AtrousLib,"SHARED_BYTES",nbytes-1)
+    assert AtrousLib.GetPoolSlots(shape,3) == 0
+    with pytest.raises(ValueError):
+        AtrousLib.BandpassPool(shape,(1.,1.,1.),processes=3)
+
+#(kernel_type, low_scale, high_scale, check_invert, check_lowpass)
+PARAMS = [(0,1,1,False,False),(0,2,3,False,False),(1,1,2,False,True),(1,2,2,False,True),(0,1,3,False,True)]
+
+def RandomVolume(shape,seed=0):
+    rng = np.random.RandomState(seed)
+    return (255*rng.random_sample(shape)).astype(np.float32)
+
+@needs_libatrous
+@pytest.mark.parametrize("params",PARAMS)
+def test_combine_planes(params):
+    dataset = RandomVolume((6,20,17))
+
+    def get_plane(scale):
+        return AtrousLib.GetBandpass(dataset,AtrousLib.GetPlaneParams(params,scale))
+
+    out = AtrousLib.CombinePlanes(dataset,params,get_plane)
+    np.testing.assert_allclose(out,AtrousLib.GetBandpass(dataset,params),rtol=1e-4,atol=1e-3)
+
+@pytest.mark.parametrize("params",PARAMS)
+def test_combine_planes_copy(params):
+    dataset = RandomVolume((4,6,5))
+    planes = {}
+
+    def get_plane(scale):
+        planes[scale] = np.full(dataset.shape,scale,np.float32)
+        return planes[scale]
+
+    #Never one of the (cached) planes or the dataset itself
+    out = AtrousLib.CombinePlanes(dataset,params,get_plane)
+    assert out is not dataset
+    assert not [plane for plane in planes.values() if np.shares_memory(out,plane)]
+
+@needs_libatrous
+@pytest.mark.parametrize("params",PARAMS)
+@pytest.mark.parametrize("shape",[(9,23,19),(31,27)])
+def test_tiled_bandpass(params,shape):
+    dataset = RandomVolume(shape,1)
+    halo = AtrousLib.GetHalo(params)
+
+    #Tiles smaller than the halo, which then reaches beyond the neighbouring tiles
+    tile = tuple([(n+2)//3 for n in shape])
+    out = AtrousLib.GetTiledBandpass(AtrousLib.IterTiles(dataset,tile,halo),shape,params)
+    np.testing.assert_allclose(out,AtrousLib.GetBandpass(dataset,params),rtol=1e-4,atol=1e-3)
+
+@needs_libatrous
+def test_tiled_bandpass_pool():
+    shape = (9,23,19)
+    params = PARAMS[1]
+    dataset = RandomVolume(shape,2)
+    halo = AtrousLib.GetHalo(params)
+    tile = (3,8,7)
+    outer = tuple([min(shape[i],tile[i]+2*halo) for i in range(len(shape))])
+
+    pool = AtrousLib.BandpassPool(outer,(1.,1.,1.),processes=2)
+    try:
+        pooled = AtrousLib.GetTiledBandpass(AtrousLib.IterTiles(dataset,tile,halo),shape,params,pool=pool)
+    finally:
+        pool.close()
+    serial = AtrousLib.GetTiledBandpass(AtrousLib.IterTiles(dataset,tile,halo),shape,params)
+    np.testing.assert_array_equal(pooled,serial)
+
+def test_tiles_cover_volume():
+    shape = (5,13,11)
+    seen = np.zeros(shape,np.int32)
+    for origin,core,tile in AtrousLib.IterTiles(np.zeros(shape,np.float32),(2,4,5),3):
+        dst = tuple([slice(origin[i]+core[i].start,origin[i]+core[i].stop) for i in range(len(shape))])
+        seen[dst] += 1
+    np.testing.assert_array_equal(seen,1)
+
+def test_tile_shape():
+    shape = (40,300,200)
+    tile = AtrousLib.GetTileShape(shape,4,1<<20)
+    assert np.prod([min(shape[i],tile[i]+8) for i in range(3)])*4 <= 1<<20
+
+    #The tiled sides are kept at least twice the halo, however small max_bytes is
+    tile = AtrousLib.GetTileShape(shape,30,1)
+    assert tile != shape
+    assert all([tile[i] >= 60 for i in range(3) if tile[i] < shape[i]])
+
+def test_use_tiles():
+    shape = (10,100,100)
+    nbytes = 10*100*100*4
+    assert not AtrousLib.UseTiles(shape,available=100*nbytes)
+    assert AtrousLib.UseTiles(shape,available=nbytes)
+
+def test_tile_bytes(monkeypatch):
+    monkeypatch.setattr(AtrousLib,"SHARED_BYTES",None)
+    nbytes = 10*100*100*4
+
+    #One tile and its working copies per process fit in the share of memory given
+    max_bytes = AtrousLib.GetTileBytes(4,available=nbytes)
+    assert max_bytes*AtrousLib.WORKING_COPIES*4 <= nbytes*AtrousLib.MEMORY_FRACTION
+
+    #The tiles grow with the memory, the two slots per process in the shared buffers too
+    available = 1<<40
+    assert AtrousLib.GetTileBytes(1,available=available) == int(available*AtrousLib.MEMORY_FRACTION) // AtrousLib.WORKING_COPIES
+    max_bytes = AtrousLib.GetTileBytes(4,available=available)
+    assert max_bytes > AtrousLib.TILE_BYTES
+    assert max_bytes*2*2*4 <= AtrousLib.GetSharedBytes(available)
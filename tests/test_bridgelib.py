@@ -0,0 +1,317 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2018 Egor Zindy <egor.zindy@manchester.ac.uk>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# vim: set ts=4 sts=4 sw=4 expandtab smartindent:
+
+"""BridgeLib logic checked on an in-memory dataset (skipped without the Imaris ICE modules)"""
+
+import os
+import numpy as np
+import pytest
+
+pytest.importorskip("Ice")
+pytest.importorskip("ImarisLib")
+import ArrayLib
+import BridgeLib
+
+class DataSet(object):
+    """Stands in for an Imaris dataset proxy: the getters return what ICE does
+    (a string for bytes, lists of numbers for shorts and floats)"""
+    types = {np.uint8:"eTypeUInt8",np.uint16:"eTypeUInt16",np.float32:"eTypeFloat"}
+
+    def __init__(self,shape=(7,5,4),nc=2,nt=3,dtype=np.uint16,name="dataset"):
+        rng = np.random.RandomState(0)
+        self.dtype = dtype
+        self.name = name
+        self.data = (100*rng.random_sample((nc,nt)+shape)).astype(dtype)
+        self.calls = 0
+
+    def __str__(self):
+        return self.name
+
+    def GetSizeX(self): return self.data.shape[4]
+    def GetSizeY(self): return self.data.shape[3]
+    def GetSizeZ(self): return self.data.shape[2]
+    def GetSizeC(self): return self.data.shape[0]
+    def GetSizeT(self): return self.data.shape[1]
+    def GetType(self): return self.types[self.dtype]
+
+    def _Encode(self,arr):
+        self.calls += 1
+        if self.dtype == np.uint8:
+            return arr.tobytes()
+        return arr.ravel().tolist()
+
+    def _Decode(self,s,shape):
+        if self.dtype == np.uint8:
+            return np.frombuffer(s,np.uint8).reshape(shape)
+        return np.asarray(s,self.dtype).reshape(shape)
+
+    def _GetVolume(self,c,t):
+        return self._Encode(self.data[c,t])
+
+    def _GetSubVolume(self,x,y,z,c,t,sx,sy,sz):
+        return self._Encode(self.data[c,t,z:z+sz,y:y+sy,x:x+sx])
+
+    def _SetSubVolume(self,s,x,y,z,c,t,sx,sy,sz):
+        self.data[c,t,z:z+sz,y:y+sy,x:x+sx] = self._Decode(s,(sz,sy,sx))
+
+    GetDataVolumeAs1DArrayBytes = GetDataVolumeAs1DArrayShorts = GetDataVolumeAs1DArrayFloats = _GetVolume
+    GetDataSubVolumeAs1DArrayBytes = GetDataSubVolumeAs1DArrayShorts = GetDataSubVolumeAs1DArrayFloats = _GetSubVolume
+    SetDataSubVolumeAs1DArrayBytes = SetDataSubVolumeAs1DArrayShorts = SetDataSubVolumeAs1DArrayFloats = _SetSubVolume
+
+###########################################################################
+## Volume transfers
+###########################################################################
+@pytest.mark.parametrize("dtype",[np.uint8,np.uint16,np.float32])
+def test_transfer_budget(dtype):
+    ds = DataSet((10,20,30),dtype=dtype)
+    plane = 20*30*BridgeLib.GetDecodedBytes(dtype)
+
+    #Shorts and floats come back as Python numbers, far larger than their array
+    assert plane >= 20*30*np.dtype(dtype).itemsize
+    assert BridgeLib.GetTransferStrategy(ds,10*plane) == ("volume",10)
+    assert BridgeLib.GetTransferStrategy(ds,4*plane) == ("slab",4)
+    assert BridgeLib.GetTransferStrategy(ds,1) == ("slab",1)
+
+@pytest.mark.parametrize("strategy,budget",[(None,None),("slab",None),("plane",None),(None,1000)])
+@pytest.mark.parametrize("dtype",[np.uint8,np.uint16,np.float32])
+def test_get_data_volume(strategy,budget,dtype):
+    ds = DataSet(dtype=dtype)
+    arr = BridgeLib.GetDataVolume(ds,1,2,strategy,budget)
+    assert arr.dtype == dtype and arr.flags.c_contiguous
+    np.testing.assert_array_equal(arr,ds.data[1,2])
+
+    transfer = BridgeLib.GetLastTransfer()
+    assert transfer["ncalls"] == ds.calls
+    assert transfer["nbytes"] == arr.nbytes
+
+###########################################################################
+## Regions of interest
+###########################################################################
+@pytest.mark.parametrize("roi,index",[
+    ((slice(1,4),),np.s_[1:4]),
+    ((2,slice(None),slice(1,3)),np.s_[2:3,:,1:3]),
+    ((-1,None,-2),np.s_[6:7,:,2:3]),
+    ((slice(-3,None),slice(0,100)),np.s_[4:,0:5]),
+    ([1,3,0,2,5,7],np.s_[5:7,0:2,1:3]),
+    ([-2,10,-2,10,-2,10],np.s_[:,:,:]),
+])
+def test_roi(roi,index):
+    ds = DataSet()
+    ref = ds.data[0,0][index]
+    x,y,z,sx,sy,sz = BridgeLib.GetROI(ds,roi)
+    np.testing.assert_array_equal(ds.data[0,0,z:z+sz,y:y+sy,x:x+sx],ref)
+
+    arr = BridgeLib.GetDataSubVolume(ds,0,1,roi)
+    np.testing.assert_array_equal(arr,ds.data[0,1][index])
+
+    BridgeLib.SetDataSubVolume(ds,arr+1,1,2,roi)
+    np.testing.assert_array_equal(ds.data[1,2][index],arr+1)
+
+@pytest.mark.parametrize("roi",[(slice(0,4,2),),(slice(3,3),),[0,4,2,2,0,7],[1,2,3]+[0]*4])
+def test_roi_invalid(roi):
+    with pytest.raises(ValueError):
+        BridgeLib.GetROI(DataSet(),roi)
+
+def test_set_roi_shape():
+    ds = DataSet()
+    with pytest.raises(ValueError):
+        BridgeLib.SetDataSubVolume(ds,np.zeros((2,2,2)),0,0,(slice(0,2),slice(0,3)))
+
+    #A 2-D array is a single plane
+    BridgeLib.SetDataSubVolume(ds,np.full((5,4),7.),0,0,(3,))
+    np.testing.assert_array_equal(ds.data[0,0,3],7)
+
+###########################################################################
+## Volume caches
+###########################################################################
+def Volume(n,value=0):
+    """A float32 volume of n*1000 bytes"""
+    return np.full((n,10,25),value,np.float32)
+
+def test_cache_lru():
+    cache = BridgeLib.VolumeCache(3000)
+    ds = DataSet()
+    keys = [BridgeLib.CacheKey(ds,0,t) for t in range(4)]
+    for t in range(3):
+        cache.put(keys[t],Volume(1,t))
+
+    #Reading an entry makes it the most recently used one
+    assert cache.get(keys[0])[0,0,0] == 0
+    cache.put(keys[3],Volume(1,3))
+    assert keys[1] not in cache
+    assert [key in cache for key in (keys[0],keys[2],keys[3])] == [True]*3
+    assert cache.nbytes == 3000
+
+    #Replacing an entry doesn't count it twice, too large an array isn't cached
+    cache.put(keys[3],Volume(1,4))
+    assert cache.nbytes == 3000 and cache.get(keys[3])[0,0,0] == 4
+    cache.put(keys[1],Volume(4))
+    assert keys[1] not in cache and len(cache) == 3
+
+def test_cache_invalidate():
+    cache = BridgeLib.VolumeCache(100000)
+    ds,other = DataSet(),DataSet(name="other")
+    for c in range(2):
+        for t in range(2):
+            cache.put(BridgeLib.CacheKey(ds,c,t),Volume(1))
+            cache.put(BridgeLib.CacheKey(ds,c,t,"filtered",(1,2)),Volume(1))
+    cache.put(BridgeLib.CacheKey(other,0,0),Volume(1))
+
+    cache.invalidate(ds,0,1)
+    assert BridgeLib.CacheKey(ds,0,1) not in cache and BridgeLib.CacheKey(ds,0,1,"filtered",(1,2)) not in cache
+    assert len(cache) == 7
+
+    cache.invalidate(ds,1)
+    assert len(cache) == 3
+    cache.invalidate(ds)
+    assert list(cache.data.keys()) == [BridgeLib.CacheKey(other,0,0)]
+    assert cache.nbytes == 1000
+
+def test_derived_channels():
+    cache = BridgeLib.VolumeCache(100000)
+    ds = DataSet()
+    key = BridgeLib.CacheKey(ds,0,1,"operation",BridgeLib.DerivedChannels((0,2)))
+    cache.put(key,Volume(1))
+
+    #Writes to another channel or another timepoint leave the entry alone
+    cache.invalidate(ds,1,1)
+    cache.invalidate(ds,2,0)
+    assert key in cache
+
+    #A write to any of the channels it is computed from invalidates it
+    cache.invalidate(ds,2,1)
+    assert key not in cache
+
+    cache.put(key,Volume(1))
+    cache.invalidate(ds,2)
+    assert key not in cache
+
+def test_write_invalidates():
+    ds = DataSet()
+    cache = BridgeLib.VolumeCache(100000)
+    arr = BridgeLib.GetCachedDataVolume(ds,1,0,cache)
+    assert BridgeLib.GetCachedDataVolume(ds,1,0,cache) is arr
+
+    BridgeLib.SetDataSubVolume(ds,np.zeros((1,5,4)),1,0,(2,))
+    assert BridgeLib.CacheKey(ds,1,0) not in cache
+    np.testing.assert_array_equal(BridgeLib.GetCachedDataVolume(ds,1,0,cache),ds.data[1,0])
+
+def SpillFiles(cache):
+    return sorted(os.listdir(cache.spill_dir))
+
+def test_spill_cache(tmpdir):
+    cache = BridgeLib.SpillCache(2000,str(tmpdir),2000)
+    ds = DataSet()
+    keys = [BridgeLib.CacheKey(ds,0,t) for t in range(5)]
+    for t in range(3):
+        cache.put(keys[t],Volume(1,t))
+
+    #The least recently used volume is spilled, and memory-mapped back
+    assert cache.nbytes == 2000 and cache.disk_bytes == 1000 and len(cache) == 3
+    arr = cache.get(keys[0])
+    assert isinstance(arr,np.memmap) and arr[0,0,0] == 0
+
+    #Once the disk budget is used, the oldest files are deleted
+    cache.put(keys[3],Volume(1,3))
+    cache.put(keys[4],Volume(1,4))
+    assert keys[0] not in cache and cache.disk_bytes == 2000
+    assert len(SpillFiles(cache)) == 2
+
+    cache.invalidate(ds,0,1)
+    assert keys[1] not in cache and cache.disk_bytes == 1000
+    cache.clear()
+    assert len(cache) == 0 and cache.disk_bytes == 0 and SpillFiles(cache) == []
+
+def test_spill_cache_empty(tmpdir):
+    cache = BridgeLib.SpillCache(1000,str(tmpdir),10000)
+    ds = DataSet()
+    arr = cache.empty((3,10,25),np.float32)
+    arr[...] = 5
+    cache.put(BridgeLib.CacheKey(ds,0,0),arr)
+
+    #Too large for memory, the array is kept in its file
+    assert SpillFiles(cache) == [os.path.basename(arr.filename)]
+    assert cache.disk_bytes == 3000
+    np.testing.assert_array_equal(cache.get(BridgeLib.CacheKey(ds,0,0)),5)
+
+    #Putting it again changes nothing
+    cache.put(BridgeLib.CacheKey(ds,0,0),arr)
+    assert len(SpillFiles(cache)) == 1 and cache.disk_bytes == 3000
+
+def test_spill_cache_shared_file(tmpdir):
+    cache = BridgeLib.SpillCache(1000,str(tmpdir),6000)
+    ds = DataSet()
+    plane_key,wavelet_key = [BridgeLib.CacheKey(ds,0,0,name) for name in ("plane","wavelet")]
+    arr = cache.empty((3,10,25),np.float32)
+    arr[...] = 7
+
+    #The same array under a second key gets a file of its own
+    cache.put(plane_key,arr)
+    cache.put(wavelet_key,arr)
+    assert len(SpillFiles(cache)) == 2 and cache.disk_bytes == 6000
+
+    #Deleting the plane's file leaves the other entry readable
+    cache.put(BridgeLib.CacheKey(ds,0,1),Volume(3))
+    assert plane_key not in cache
+    assert len(SpillFiles(cache)) == 2 and cache.disk_bytes == 6000
+    np.testing.assert_array_equal(cache.get(wavelet_key),7)
+
+    #An array read back from another entry's file is copied too
+    small_key = BridgeLib.CacheKey(ds,1,0)
+    cache.put(small_key,cache.get(wavelet_key)[0])
+    assert not isinstance(cache.get(small_key),np.memmap)
+    cache.pop(wavelet_key)
+    np.testing.assert_array_equal(cache.get(small_key),7)
+
+###########################################################################
+## Histograms
+###########################################################################
+@pytest.mark.parametrize("dtype",[np.uint8,np.uint16,np.float32])
+def test_histogram_streamed(monkeypatch,dtype):
+    ds = DataSet((6,5,4),dtype=dtype)
+    index = BridgeLib.VolumeCache()
+
+    #Read one plane at a time, the whole volume is never fetched
+    def GetDataVolume(*args,**kwargs):
+        raise AssertionError("whole volume read")
+    monkeypatch.setattr(BridgeLib,"GetDataVolume",GetDataVolume)
+    monkeypatch.setattr(BridgeLib,"BULK_READ_BYTES",5*4*BridgeLib.GetDecodedBytes(dtype))
+    histogram = BridgeLib.GetHistogram(ds,1,2,index=index)
+    assert ds.calls == 6
+
+    ref = ArrayLib.VolumeHistogram(dtype).add(ds.data[1,2])
+    assert (histogram.total,histogram.min,histogram.max) == (ref.total,ref.min,ref.max)
+    if histogram.exact:
+        np.testing.assert_array_equal(histogram.counts,ref.counts)
+    assert abs(histogram.percentile(50)-np.percentile(ds.data[1,2],50)) <= histogram.width
+
+    #Kept until the channel is written to
+    assert BridgeLib.GetHistogram(ds,1,2,index=index) is histogram
+    BridgeLib.SetDataSubVolume(ds,np.zeros((1,5,4)),1,2,(0,))
+    assert BridgeLib.GetHistogram(ds,1,2,index=index) is not histogram
+
+def test_histogram_derived():
+    ds = DataSet()
+    index = BridgeLib.VolumeCache()
+    with pytest.raises(ValueError):
+        BridgeLib.GetHistogram(ds,0,0,derived=("wavelet",),index=index)
+
+    arr = np.arange(10,dtype=np.float32)
+    histogram = BridgeLib.GetHistogram(ds,0,0,arr,("wavelet",),index=index)
+    assert (histogram.min,histogram.max,histogram.total) == (0,9,10)
+    assert BridgeLib.CacheKey(ds,0,0,"wavelet") in index